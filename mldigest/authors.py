@@ -0,0 +1,42 @@
+from __future__ import annotations
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from mldigest.config import load_config
+from mldigest.storage.author_index import AuthorIndex, default_author_index_path
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List recent papers by an author from the local author index")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument("author", help="Author name in any form, e.g. 'Yann LeCun' or 'LeCun, Y.'")
+    parser.add_argument("--days", type=int, default=None, help="Only papers published in the last N days")
+    parser.add_argument("--limit", type=int, default=20, help="Number of results")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    since = None
+    if args.days is not None:
+        since = (datetime.now(timezone.utc) - timedelta(days=args.days)).strftime("%Y-%m-%d")
+
+    with AuthorIndex(default_author_index_path(cfg)) as index:
+        started = time.perf_counter()
+        papers = index.recent_papers(args.author, since=since, limit=args.limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for paper_id, title, published_at in papers:
+            print(f"{(published_at or '')[:10]}  {paper_id}  {title}")
+        logger.info(
+            "%d papers for %s (seen as: %s) over %d authors in %.1f ms",
+            len(papers),
+            args.author,
+            ", ".join(index.names(args.author)) or "-",
+            len(index),
+            elapsed_ms,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+import argparse
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta, timezone
+from mldigest.config import load_config
+from mldigest.ingest.arxiv_client import ARXIV_API, REQUEST_INTERVAL, configure_rate_limit, fetch_arxiv_shard
+from mldigest.signals.registry import SignalContext, run_signals
+from mldigest.storage.author_index import AuthorIndex, default_author_index_path
+from mldigest.storage.paper_store import PaperStore, default_store_path
+from mldigest.storage.search_index import SearchIndex, default_index_path
+from mldigest.storage.topic_rollups import TopicRollups, default_rollup_path
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+MAX_PER_CHUNK = 2000
+
+
+def _chunks(start: date, end: date, categories: list[str]) -> list[tuple[str, str, datetime, datetime]]:
+    chunks = []
+    day = start
+    while day <= end:
+        day_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        day_end = day_start + timedelta(days=1) - timedelta(minutes=1)
+        for category in categories:
+            chunks.append((f"arxiv:{category}:{day.isoformat()}", category, day_start, day_end))
+        day += timedelta(days=1)
+    return chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resumable historical arXiv backfill")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument("--start", required=True, type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, type=date.fromisoformat, help="Last day, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=2, help="Chunks fetched concurrently")
+    parser.add_argument("--no-index", action="store_true", help="Do not add papers to the search and author indexes")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    arxiv_cfg = cfg["sources"]["arxiv"]
+    categories = arxiv_cfg["categories"]
+    base_url = arxiv_cfg.get("base_url") or ARXIV_API
+    configure_rate_limit(float(arxiv_cfg.get("request_interval", REQUEST_INTERVAL)))
+    buckets = cfg["topics"]["buckets"]
+    topics_context = SignalContext(
+        hf_hits={}, buckets=buckets, window_days=int(cfg["schedule"]["window_days"]), now=datetime.now(timezone.utc)
+    )
+    store = PaperStore(default_store_path(cfg))
+    rollups = TopicRollups(default_rollup_path(cfg))
+    rollups.sync_buckets(buckets)
+    index = None if args.no_index else SearchIndex(default_index_path(cfg))
+    authors = None if args.no_index else AuthorIndex(default_author_index_path(cfg))
+
+    done = store.completed_chunks()
+    pending = [chunk for chunk in _chunks(args.start, args.end, categories) if chunk[0] not in done]
+    logger.info(
+        "Backfill %s..%s: %d chunks pending, %d already done", args.start, args.end, len(pending), len(done)
+    )
+
+    fetched = failed = 0
+    started = time.perf_counter()
+    queue = iter(pending)
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            in_flight = {}
+
+            def submit_next() -> None:
+                chunk = next(queue, None)
+                if chunk:
+                    _key, category, day_start, day_end = chunk
+                    shard_stats: dict = {}
+                    future = pool.submit(
+                        fetch_arxiv_shard,
+                        category,
+                        day_start,
+                        day_end,
+                        0,
+                        MAX_PER_CHUNK,
+                        base_url=base_url,
+                        stats=shard_stats,
+                    )
+                    in_flight[future] = (chunk[0], shard_stats)
+
+            for _ in range(args.workers):
+                submit_next()
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk_key, shard_stats = in_flight.pop(future)
+                    try:
+                        papers = future.result()
+                    except Exception as exc:  # pragma: no cover - unexpected shard failure
+                        failed += 1
+                        logger.warning("Chunk %s failed, will retry on resume: %s", chunk_key, exc)
+                    else:
+                        if len(papers) >= MAX_PER_CHUNK:
+                            logger.warning("Chunk %s hit the %d paper cap", chunk_key, MAX_PER_CHUNK)
+                        # Every derived store applies papers idempotently, so the chunk is marked
+                        # complete last: a crash before that just redoes the whole chunk on resume.
+                        run_signals(papers, topics_context, names=["topics"])
+                        rollups.add_papers(papers)
+                        if index is not None:
+                            index.add_papers(papers)
+                            authors.add_papers(papers)
+                        if shard_stats.get("error"):
+                            # Keep the pages that did arrive, but leave the chunk pending.
+                            failed += 1
+                            store.add_papers(papers)
+                            logger.warning(
+                                "Chunk %s stopped after %d page(s), will retry on resume: %s",
+                                chunk_key,
+                                shard_stats["pages"],
+                                shard_stats["error"],
+                            )
+                        else:
+                            store.write_chunk(chunk_key, papers)
+                        fetched += len(papers)
+                    submit_next()
+                elapsed = time.perf_counter() - started
+                logger.info("%d papers, %.2f papers/s", fetched, fetched / elapsed if elapsed else 0.0)
+    finally:
+        store.close()
+        rollups.close()
+        if index is not None:
+            index.close()
+            authors.close()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Backfill finished: %d papers in %.1fs (%.2f papers/s), %d chunks failed",
+        fetched,
+        elapsed,
+        fetched / elapsed if elapsed else 0.0,
+        failed,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,148 @@
 """arXiv API client."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import List
 
 import feedparser
-import requests
 
 from mldigest.models import Paper
-from mldigest.utils import dedupe_arxiv_id, filter_by_window
+from mldigest.utils import (
+    RateLimiter,
+    dedupe_arxiv_id,
+    filter_by_window,
+    get_logger,
+    get_with_retry,
+    window_bounds,
+)
+
+logger = get_logger(__name__)
 
 ARXIV_API = "https://export.arxiv.org/api/query"
+PAGE_SIZE = 200
+# arXiv asks API clients to start no more than one request every three seconds.
+REQUEST_INTERVAL = 3.0
+
+_rate_limiter = RateLimiter(REQUEST_INTERVAL)
+
+
+def configure_rate_limit(interval: float) -> None:
+    """Change the spacing between arXiv requests (e.g. 0 against a local mock)."""
+    _rate_limiter.min_interval = interval
 
 
-def _build_query(categories: list[str]) -> str:
+def _format_date(value: datetime) -> str:
+    return value.strftime("%Y%m%d%H%M")
+
+
+def _build_query(
+    categories: list[str],
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> str:
     parts = [f"cat:{cat}" for cat in categories]
-    return " OR ".join(parts)
+    query = " OR ".join(parts)
+    if start_date is None or end_date is None:
+        return query
+    if len(parts) > 1:
+        query = f"({query})"
+    return f"{query} AND submittedDate:[{_format_date(start_date)} TO {_format_date(end_date)}]"
+
+
+def _paper_from_entry(entry) -> Paper:
+    arxiv_id = entry.get("id", "").split("/abs/")[-1]
+    links = {}
+    abs_url = entry.get("link")
+    if abs_url:
+        links["abs_url"] = abs_url
+    pdf_url = None
+    for link in entry.get("links", []):
+        if link.get("type") == "application/pdf":
+            pdf_url = link.get("href")
+    if pdf_url:
+        links["pdf_url"] = pdf_url
+    categories_list = [tag.get("term") for tag in entry.get("tags", []) if tag.get("term")]
+    return Paper(
+        paper_id=f"arxiv:{arxiv_id}",
+        title=entry.get("title", "").replace("\n", " ").strip(),
+        authors=[author.get("name") for author in entry.get("authors", []) if author.get("name")],
+        abstract=entry.get("summary", "").replace("\n", " ").strip(),
+        published_at=entry.get("published"),
+        categories=categories_list,
+        links=links,
+        source_tags=["arxiv"],
+        signals={"arxiv_id": dedupe_arxiv_id(arxiv_id)},
+    )
+
+
+def fetch_arxiv_shard(
+    category: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    start: int = 0,
+    max_results: int = PAGE_SIZE,
+    sort_by: str = "submittedDate",
+    sort_order: str = "descending",
+    base_url: str = ARXIV_API,
+    stats: dict | None = None,
+) -> List[Paper]:
+    """Fetch one category (optionally limited to a submittedDate range), page by page.
+
+    A failing page ends the shard without discarding the pages already
+    fetched: the papers so far are returned and the failure is recorded as
+    ``error`` in ``stats`` (with the number of ``pages`` read), so callers can
+    tell a partial shard from a complete one.
+    """
+    stats = stats if stats is not None else {}
+    stats.update(pages=0, error=None)
+    query = _build_query([category], start_date, end_date)
+    papers: list[Paper] = []
+    offset = start
+    while len(papers) < max_results:
+        page_size = min(PAGE_SIZE, max_results - len(papers))
+        params = {
+            "search_query": query,
+            "start": offset,
+            "max_results": page_size,
+            "sortBy": sort_by,
+            "sortOrder": sort_order,
+        }
+        try:
+            response = get_with_retry(
+                base_url, params=params, timeout=30, source="arxiv", rate_limiter=_rate_limiter
+            )
+        except Exception as exc:  # pragma: no cover - network failure
+            stats["error"] = str(exc)
+            logger.warning(
+                "arXiv %s failed after %d page(s), keeping %d entries: %s",
+                category,
+                stats["pages"],
+                len(papers),
+                exc,
+            )
+            break
+        stats["pages"] += 1
+        feed = feedparser.parse(response.text)
+        papers.extend(_paper_from_entry(entry) for entry in feed.entries)
+        if len(feed.entries) < page_size:
+            break
+        offset += page_size
+    return papers
+
+
+def merge_shards(shards: List[List[Paper]]) -> List[Paper]:
+    """Concatenate shards, keeping the first copy of each cross-listed paper."""
+    seen: set[str] = set()
+    papers: list[Paper] = []
+    for shard in shards:
+        for paper in shard:
+            key = dedupe_arxiv_id(paper.signals.get("arxiv_id") or paper.paper_id.replace("arxiv:", ""))
+            if key in seen:
+                continue
+            seen.add(key)
+            papers.append(paper)
+    return papers
 
 
 def fetch_arxiv_papers(
@@ -24,46 +152,39 @@ def fetch_arxiv_papers(
     sort_by: str = "submittedDate",
     sort_order: str = "descending",
     window_days: int | None = None,
+    max_workers: int = 4,
+    base_url: str = ARXIV_API,
 ) -> List[Paper]:
-    query = _build_query(categories)
-    params = {
-        "search_query": query,
-        "start": start,
-        "max_results": max_results,
-        "sortBy": sort_by,
-        "sortOrder": sort_order,
-    }
-    response = requests.get(ARXIV_API, params=params, timeout=30)
-    response.raise_for_status()
-    feed = feedparser.parse(response.text)
-    papers: list[Paper] = []
-    for entry in feed.entries:
-        arxiv_id = entry.get("id", "").split("/abs/")[-1]
-        paper_id = f"arxiv:{arxiv_id}"
-        if window_days is not None and not filter_by_window(entry.get("published"), window_days):
-            continue
-        links = {}
-        abs_url = entry.get("link")
-        if abs_url:
-            links["abs_url"] = abs_url
-        pdf_url = None
-        for link in entry.get("links", []):
-            if link.get("type") == "application/pdf":
-                pdf_url = link.get("href")
-        if pdf_url:
-            links["pdf_url"] = pdf_url
-        categories_list = [tag.get("term") for tag in entry.get("tags", []) if tag.get("term")]
-        papers.append(
-            Paper(
-                paper_id=paper_id,
-                title=entry.get("title", "").replace("\n", " ").strip(),
-                authors=[author.get("name") for author in entry.get("authors", []) if author.get("name")],
-                abstract=entry.get("summary", "").replace("\n", " ").strip(),
-                published_at=entry.get("published"),
-                categories=categories_list,
-                links=links,
-                source_tags=["arxiv"],
-                signals={"arxiv_id": dedupe_arxiv_id(arxiv_id)},
-            )
+    """Fetch every category as its own shard, restricted server-side to the window.
+
+    ``max_results`` is a per-category budget so a busy category cannot starve
+    the others. Shards run concurrently but share the module rate limiter.
+    """
+    start_date = end_date = None
+    if window_days is not None:
+        start_date, end_date = window_bounds(window_days)
+
+    shard_stats: dict[str, dict] = {category: {} for category in categories}
+
+    def fetch(category: str) -> List[Paper]:
+        return fetch_arxiv_shard(
+            category,
+            start_date,
+            end_date,
+            start,
+            max_results,
+            sort_by,
+            sort_order,
+            base_url,
+            stats=shard_stats[category],
         )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(categories)))) as pool:
+        shards = list(pool.map(fetch, categories))
+    for category, shard in zip(categories, shards):
+        partial = " (partial)" if shard_stats[category].get("error") else ""
+        logger.info("arXiv %s: %d entries%s", category, len(shard), partial)
+    papers = merge_shards(shards)
+    if window_days is not None:
+        papers = [paper for paper in papers if filter_by_window(paper.published_at, window_days)]
     return papers
@@ -4,20 +4,19 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Dict
 
-import requests
-
-from mldigest.utils import get_logger, normalize_title
+from mldigest.utils import get_logger, get_with_retry, normalize_title
 
 logger = get_logger(__name__)
 
 HF_ENDPOINT = "https://huggingface.co/api/daily_papers"
 
 
-def fetch_hf_hits(month: str, per_query: int = 50) -> Dict[str, dict]:
+def fetch_hf_hits(month: str, per_query: int = 50, base_url: str = HF_ENDPOINT) -> Dict[str, dict]:
     results: dict[str, dict] = defaultdict(lambda: {"matched": True, "query_hits": [], "best_rank_proxy": 0})
     try:
-        response = requests.get(HF_ENDPOINT, params={"month": month, "sort": "trending"}, timeout=20)
-        response.raise_for_status()
+        response = get_with_retry(
+            base_url, params={"month": month, "sort": "trending"}, timeout=20, source="hf"
+        )
         data = response.json()
     except Exception as exc:  # pragma: no cover - network failure
         logger.warning("HF daily papers failed for %s: %s", month, exc)
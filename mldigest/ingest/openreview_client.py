@@ -1,15 +1,31 @@
 """OpenReview ingestion client."""
 from __future__ import annotations
 
-from typing import List
-
-import requests
+import tracemalloc
+from typing import Iterator, List
 
 from mldigest.models import Paper
-from mldigest.utils import get_logger
+from mldigest.utils import get_logger, get_with_retry, iso_timestamp
 
 logger = get_logger(__name__)
 
+OPENREVIEW_API = "https://api.openreview.net"
+PAGE_SIZE = 1000
+# Only the fields that end up in ``Paper`` or the quality signal.
+NOTE_FIELDS = [
+    "id",
+    "forum",
+    "pdate",
+    "content.title",
+    "content.authors",
+    "content.abstract",
+    "content.venue",
+    "content.venueid",
+    "content.decision",
+    "content.mean_rating",
+    "content.confidence",
+]
+
 
 def _extract_value(field, default=None):
     if isinstance(field, dict):
@@ -17,114 +33,318 @@ def _extract_value(field, default=None):
     return field if field is not None else default
 
 
-def _notes_from_rest(venue: str) -> list[dict]:
-    url = "https://api.openreview.net/notes"
-    params = {"content.venue": venue, "limit": 200}
-    response = requests.get(url, params=params, timeout=30)
-    response.raise_for_status()
-    data = response.json()
-    return data.get("notes", [])
+def _venue_filter(venue: str, accept_only: bool) -> dict:
+    # Accepted papers carry the bare venue id; everything else lives under the
+    # venue's submission invitation, so both filters run server-side.
+    if accept_only:
+        return {"content.venueid": venue}
+    return {"invitation": f"{venue}/-/Submission"}
+
+
+def _iter_notes_from_rest(venue: str, accept_only: bool, stats: dict, base_url: str) -> Iterator[dict]:
+    url = f"{base_url}/notes"
+    offset = 0
+    while True:
+        params = {
+            **_venue_filter(venue, accept_only),
+            "select": ",".join(NOTE_FIELDS),
+            "offset": offset,
+            "limit": PAGE_SIZE,
+        }
+        response = get_with_retry(url, params=params, timeout=30, source="openreview")
+        stats["bytes"] += len(response.content)
+        stats["pages"] += 1
+        notes = response.json().get("notes", [])
+        yield from notes
+        if len(notes) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+
+
+def _iter_notes_from_client(client, venue: str, accept_only: bool) -> Iterator[dict]:
+    offset = 0
+    content_filter = {"venueid": venue} if accept_only else None
+    invitation = None if accept_only else f"{venue}/-/Submission"
+    while True:
+        notes = client.get_notes(
+            content=content_filter,
+            invitation=invitation,
+            select=",".join(NOTE_FIELDS),
+            offset=offset,
+            limit=PAGE_SIZE,
+        )
+        for note in notes:
+            yield {"id": note.id, "forum": note.forum, "pdate": note.pdate, "content": note.content or {}}
+        if len(notes) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
 
 
-def _decision_from_rest(note_id: str) -> dict:
-    url = "https://api.openreview.net/notes"
-    params = {"forum": note_id, "limit": 50}
-    response = requests.get(url, params=params, timeout=30)
-    response.raise_for_status()
+def _decision_info(content: dict) -> dict:
+    return {
+        "decision": _extract_value(content.get("decision")),
+        "mean_rating": _extract_value(content.get("mean_rating")),
+        "confidence": _extract_value(content.get("confidence")),
+    }
+
+
+def _decision_from_rest(forum: str, base_url: str = OPENREVIEW_API) -> dict:
+    url = f"{base_url}/notes"
+    params = {"forum": forum, "limit": 50}
+    response = get_with_retry(url, params=params, timeout=30, source="openreview")
     data = response.json()
     for note in data.get("notes", []):
         content = note.get("content", {})
         if "decision" in content:
-            return {
-                "decision": _extract_value(content.get("decision")),
-                "mean_rating": _extract_value(content.get("mean_rating")),
-                "confidence": _extract_value(content.get("confidence")),
-            }
+            return _decision_info(content)
     return {}
 
 
-def fetch_openreview_papers(venues: list[str], accept_only: bool = True) -> List[Paper]:
+def _paper_from_note(note: dict, venue: str, decision_info: dict) -> Paper:
+    content = note.get("content", {})
+    signals = {
+        "openreview": {
+            "venue": venue,
+            "decision": decision_info.get("decision") or _extract_value(content.get("decision")),
+            "mean_rating": decision_info.get("mean_rating") or _extract_value(content.get("mean_rating")),
+            "confidence": decision_info.get("confidence") or _extract_value(content.get("confidence")),
+            # Decisions and reviews hang off the submission's forum, whichever paper this signal ends up on.
+            "forum": note.get("forum") or note.get("id"),
+        }
+    }
+    return Paper(
+        paper_id=f"openreview:{note.get('id')}",
+        title=_extract_value(content.get("title"), ""),
+        authors=_extract_value(content.get("authors"), []),
+        abstract=_extract_value(content.get("abstract")),
+        published_at=iso_timestamp(note.get("pdate")),
+        categories=[venue],
+        links={"openreview_url": f"https://openreview.net/forum?id={note.get('id')}"},
+        source_tags=["openreview"],
+        signals=signals,
+    )
+
+
+def _is_rejected(decision) -> bool:
+    return bool(decision) and "accept" not in str(decision).lower()
+
+
+def _pending_forum(paper: Paper) -> str | None:
+    signal = paper.signals.get("openreview")
+    if not signal or not signal.get("decision_pending"):
+        return None
+    return signal.get("forum")
+
+
+def _apply_decision(signal: dict, decision_info: dict) -> bool:
+    """Copy a found decision into ``signal`` and clear ``decision_pending``; False if there is none yet."""
+    if not decision_info.get("decision"):
+        return False
+    for key in ("decision", "mean_rating", "confidence"):
+        if decision_info.get(key):
+            signal[key] = decision_info[key]
+    signal["decision_pending"] = False
+    if _is_rejected(signal["decision"]):
+        signal["rejected"] = True
+    return True
+
+
+def prefetch_decisions(papers: List[Paper], base_url: str = OPENREVIEW_API) -> int:
+    """Resolve pending decisions from one paged decision listing per venue; returns papers resolved.
+
+    This costs a handful of requests per venue instead of one per paper, so
+    it can run over every candidate before screening. It pays off only when
+    submissions of every outcome were ingested (``accept_only`` off): it
+    drops rejections before screening. Papers it cannot resolve stay
+    ``decision_pending`` for :func:`enrich_decisions`.
+    """
+    # venue -> forum -> signals; a merged paper shares its signal dict with the OpenReview copy.
+    pending: dict[str, dict[str, dict[int, dict]]] = {}
+    for paper in papers:
+        forum = _pending_forum(paper)
+        if forum:
+            signal = paper.signals["openreview"]
+            pending.setdefault(signal.get("venue") or "", {}).setdefault(forum, {})[id(signal)] = signal
+    resolved = 0
+    url = f"{base_url}/notes"
+    for venue, by_forum in pending.items():
+        offset = 0
+        try:
+            while True:
+                params = {
+                    "invitation": f"{venue}/-/Decision",
+                    "select": "forum,content.decision,content.mean_rating,content.confidence",
+                    "offset": offset,
+                    "limit": PAGE_SIZE,
+                }
+                notes = get_with_retry(url, params=params, timeout=30, source="openreview").json().get("notes", [])
+                for note in notes:
+                    for signal in by_forum.get(note.get("forum"), {}).values():
+                        resolved += _apply_decision(signal, _decision_info(note.get("content", {})))
+                if len(notes) < PAGE_SIZE:
+                    break
+                offset += PAGE_SIZE
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.warning("OpenReview decision listing failed for venue %s: %s", venue, exc)
+    return resolved
+
+
+def enrich_decisions(papers: List[Paper], base_url: str = OPENREVIEW_API) -> int:
+    """Fetch deferred decisions for ``papers`` in place; returns the number of lookups.
+
+    Lookups go by the OpenReview forum id recorded in the signal, so arXiv
+    papers that absorbed an OpenReview submission are enriched too. Papers
+    whose decision turns out to be a rejection are flagged ``rejected``; a
+    failed lookup, or one that finds no decision, leaves the paper pending.
+    """
+    looked_up = 0
+    for paper in papers:
+        forum = _pending_forum(paper)
+        if not forum:
+            continue
+        try:
+            decision_info = _decision_from_rest(forum, base_url)
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.warning("OpenReview decision fetch failed: %s", exc)
+            continue
+        looked_up += 1
+        _apply_decision(paper.signals["openreview"], decision_info)
+    return looked_up
+
+
+def _count_response_bytes(client, stats: dict):
+    """Attach a response hook to the client's session; returns the hook list to detach from."""
+    session = getattr(client, "session", None)
+    if session is None:
+        return None
+
+    def hook(response, *args, **kwargs):
+        stats["bytes"] += len(response.content or b"")
+        stats["pages"] += 1
+
+    hooks = session.hooks.setdefault("response", [])
+    hooks.append(hook)
+    return hooks
+
+
+def _new_stats() -> dict:
+    return {"notes": 0, "papers": 0, "pages": 0, "bytes": 0}
+
+
+def _collect_venue(
+    notes: Iterator[dict],
+    venue: str,
+    accept_only: bool,
+    stats: dict,
+    lookup_decisions: bool,
+    base_url: str = OPENREVIEW_API,
+    decisions_deferred: bool = False,
+    trace_memory: bool = False,
+) -> list[Paper]:
+    """Turn a note stream into papers.
+
+    With ``decisions_deferred`` the per-note decision request is skipped and the
+    paper is marked ``decision_pending`` for :func:`prefetch_decisions` and
+    :func:`enrich_decisions`. With
+    ``trace_memory`` the peak Python allocation while the stream is consumed
+    is recorded as ``peak_memory_bytes``; tracemalloc slows every allocation
+    down, so it is off unless asked for.
+    """
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+    papers: list[Paper] = []
+    try:
+        for note in notes:
+            stats["notes"] += 1
+            decision_info = {}
+            if lookup_decisions:
+                try:
+                    decision_info = _decision_from_rest(note.get("id"), base_url)
+                except Exception as exc:  # pragma: no cover
+                    logger.warning("OpenReview decision fetch failed: %s", exc)
+            paper = _paper_from_note(note, venue, decision_info)
+            if decisions_deferred:
+                paper.signals["openreview"]["decision_pending"] = True
+            if accept_only and _is_rejected(paper.signals["openreview"]["decision"]):
+                continue
+            papers.append(paper)
+    finally:
+        if trace_memory:
+            stats["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        if tracing:
+            tracemalloc.stop()
+    stats["papers"] = len(papers)
+    logger.info(
+        "OpenReview %s: %d notes -> %d papers, %d pages, %.1f KiB transferred%s",
+        venue,
+        stats["notes"],
+        stats["papers"],
+        stats["pages"],
+        stats["bytes"] / 1024,
+        f", peak {stats['peak_memory_bytes'] / 1024:.1f} KiB" if trace_memory else "",
+    )
+    return papers
+
+
+def fetch_openreview_papers(
+    venues: list[str],
+    accept_only: bool = True,
+    stats: dict | None = None,
+    base_url: str = OPENREVIEW_API,
+    lookup_decisions: bool = True,
+    trace_memory: bool = False,
+) -> List[Paper]:
+    """Stream each venue page by page into ``Paper`` objects.
+
+    Per-venue transfer figures are written into ``stats`` when given, plus the
+    peak memory with ``trace_memory``.
+    The REST fallback costs one extra request per note to read decisions; pass
+    ``lookup_decisions=False`` to defer that to :func:`enrich_decisions`.
+    """
+    stats = stats if stats is not None else {}
     papers: list[Paper] = []
     try:
         import openreview  # type: ignore
 
-        client = openreview.api.OpenReviewClient(baseurl="https://api.openreview.net")
+        client = openreview.api.OpenReviewClient(baseurl=base_url)
         for venue in venues:
-            notes = client.get_all_notes(content={"venue": venue})
-            for note in notes:
-                content = note.content or {}
-                decision = content.get("decision")
-                if isinstance(decision, dict):
-                    decision = decision.get("value")
-                if accept_only and decision and "accept" not in str(decision).lower():
-                    continue
-                openreview_url = f"https://openreview.net/forum?id={note.id}"
-                signals = {
-                    "openreview": {
-                        "venue": venue,
-                        "decision": decision,
-                        "mean_rating": content.get("mean_rating", {}).get("value")
-                        if isinstance(content.get("mean_rating"), dict)
-                        else content.get("mean_rating"),
-                        "confidence": content.get("confidence", {}).get("value")
-                        if isinstance(content.get("confidence"), dict)
-                        else content.get("confidence"),
-                    }
-                }
-                papers.append(
-                    Paper(
-                        paper_id=f"openreview:{note.id}",
-                        title=content.get("title", {}).get("value", ""),
-                        authors=content.get("authors", {}).get("value", []),
-                        abstract=content.get("abstract", {}).get("value"),
-                        published_at=note.pdate,
-                        categories=[venue],
-                        links={"openreview_url": openreview_url},
-                        source_tags=["openreview"],
-                        signals=signals,
+            venue_stats = stats[venue] = _new_stats()
+            hooks = _count_response_bytes(client, venue_stats)
+            notes = _iter_notes_from_client(client, venue, accept_only)
+            try:
+                papers.extend(
+                    _collect_venue(
+                        notes, venue, accept_only, venue_stats, lookup_decisions=False, trace_memory=trace_memory
                     )
                 )
+            finally:
+                if hooks:
+                    hooks.pop()
         return papers
     except Exception as exc:  # pragma: no cover - fallback for runtime
         logger.warning("OpenReview client failed, fallback to REST: %s", exc)
+        papers = []
 
     for venue in venues:
+        venue_stats = stats[venue] = _new_stats()
+        notes = _iter_notes_from_rest(venue, accept_only, venue_stats, base_url)
         try:
-            notes = _notes_from_rest(venue)
+            papers.extend(
+                _collect_venue(
+                    notes,
+                    venue,
+                    accept_only,
+                    venue_stats,
+                    lookup_decisions=accept_only and lookup_decisions,
+                    base_url=base_url,
+                    decisions_deferred=not lookup_decisions,
+                    trace_memory=trace_memory,
+                )
+            )
         except Exception as exc:  # pragma: no cover - network failure
             logger.warning("OpenReview REST failed for venue %s: %s", venue, exc)
             continue
-        for note in notes:
-            content = note.get("content", {})
-            decision_info = {}
-            if accept_only:
-                try:
-                    decision_info = _decision_from_rest(note.get("id"))
-                except Exception as exc:  # pragma: no cover
-                    logger.warning("OpenReview decision fetch failed: %s", exc)
-            decision = decision_info.get("decision") or _extract_value(content.get("decision"))
-            if accept_only and decision and "accept" not in str(decision).lower():
-                continue
-            openreview_url = f"https://openreview.net/forum?id={note.get('id')}"
-            signals = {
-                "openreview": {
-                    "venue": venue,
-                    "decision": decision,
-                    "mean_rating": decision_info.get("mean_rating"),
-                    "confidence": decision_info.get("confidence"),
-                }
-            }
-            papers.append(
-                Paper(
-                    paper_id=f"openreview:{note.get('id')}",
-                    title=_extract_value(content.get("title"), ""),
-                    authors=_extract_value(content.get("authors"), []),
-                    abstract=_extract_value(content.get("abstract")),
-                    published_at=note.get("pdate"),
-                    categories=[venue],
-                    links={"openreview_url": openreview_url},
-                    source_tags=["openreview"],
-                    signals=signals,
-                )
-            )
     return papers
@@ -0,0 +1,176 @@
+from __future__ import annotations
+import argparse
+import copy
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, replace
+from datetime import datetime
+from pathlib import Path
+import yaml
+from mldigest.config import load_config
+from mldigest.mocks.servers import SCENARIOS, MockDataset, MockUpstream, RequestRecord
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _latency_summary(records: list[RequestRecord]) -> dict:
+    seconds = [record.seconds for record in records]
+    return {
+        "requests": len(records),
+        "errors": sum(1 for record in records if record.status >= 500),
+        "throttled": sum(1 for record in records if record.status == 429),
+        "bytes": sum(record.bytes for record in records),
+        "p50_ms": round(_percentile(seconds, 50) * 1000, 1),
+        "p95_ms": round(_percentile(seconds, 95) * 1000, 1),
+        "p99_ms": round(_percentile(seconds, 99) * 1000, 1),
+        "max_ms": round(max(seconds, default=0.0) * 1000, 1),
+    }
+
+
+def _scenario_config(cfg: dict, base_urls: dict, workdir: Path) -> dict:
+    cfg = copy.deepcopy(cfg)
+    sources = cfg["sources"]
+    for name, url in base_urls.items():
+        sources[name]["base_url"] = url
+    sources["arxiv"]["request_interval"] = 0
+    sources["hf"]["month"] = datetime.now().strftime("%Y-%m")
+    cfg["email"]["enabled"] = False
+    cfg["storage"] = {"runs_dir": str(workdir / "runs")}
+    return cfg
+
+
+# CLI flag -> Scenario field, applied on top of every preset that runs.
+OVERRIDES = {
+    "latency_ms": "latency_median_ms",
+    "latency_sigma": "latency_sigma",
+    "error_rate": "error_rate",
+    "throttle_rate": "throttle_rate",
+    "retry_after": "retry_after_seconds",
+    "papers_per_category": "papers_per_category",
+    "abstract_words": "abstract_words",
+}
+
+
+def run_scenario(cfg: dict, scenario_name: str, timeout: float, overrides: dict | None = None) -> dict:
+    scenario = replace(SCENARIOS[scenario_name], **(overrides or {}))
+    categories = cfg["sources"]["arxiv"]["categories"]
+    venues = cfg["sources"]["openreview"]["venues"]
+    dataset = MockDataset(scenario, categories, venues, int(cfg["schedule"]["window_days"]))
+    expected = dataset.expected_counts(categories, int(cfg["limits"]["arxiv_max_results"]))
+
+    with tempfile.TemporaryDirectory() as tmp, MockUpstream(scenario, dataset) as upstream:
+        workdir = Path(tmp)
+        config_path = workdir / "config.yaml"
+        config_path.write_text(
+            # Key order matters: topics.buckets order decides each paper's primary topic.
+            yaml.safe_dump(_scenario_config(cfg, upstream.start(), workdir), allow_unicode=True, sort_keys=False),
+            encoding="utf-8",
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parent.parent))
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-m", "mldigest.run", "--config", str(config_path), "--dry-run"],
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            returncode = completed.returncode
+        except subprocess.TimeoutExpired:
+            returncode = None
+        elapsed = time.perf_counter() - started
+
+        counts: dict = {}
+        artifacts = sorted((workdir / "runs").glob("digest_*[0-9].json"))
+        if artifacts:
+            counts = json.loads(artifacts[-1].read_text(encoding="utf-8")).get("counts", {})
+        if returncode != 0:
+            logger.warning("Scenario %s: run exited with %s", scenario_name, returncode)
+
+    recovered = {
+        key: round(counts.get(key, 0) / value, 3) if value else None for key, value in expected.items()
+    }
+    by_api = {
+        api: _latency_summary([record for record in upstream.records if record.api == api])
+        for api in ("arxiv", "hf", "openreview")
+    }
+    return {
+        "scenario": scenario_name,
+        "settings": asdict(scenario),
+        "returncode": returncode,
+        "seconds": round(elapsed, 2),
+        "expected": expected,
+        "counts": counts,
+        "recovered": recovered,
+        "upstream": by_api,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test ingestion against local mock upstreams")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument(
+        "--scenarios",
+        default="baseline,slow,flaky,throttled",
+        help=f"Comma-separated scenarios ({', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--timeout", type=float, default=900, help="Per-scenario timeout in seconds")
+    parser.add_argument("--latency-ms", type=float, help="Override the median upstream latency")
+    parser.add_argument("--latency-sigma", type=float, help="Override the log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, help="Override the share of requests answered with a 5xx")
+    parser.add_argument("--throttle-rate", type=float, help="Override the share of requests answered with a 429")
+    parser.add_argument("--retry-after", type=float, help="Override the Retry-After seconds sent with a 429")
+    parser.add_argument("--papers-per-category", type=int, help="Override the arXiv papers per category")
+    parser.add_argument("--abstract-words", type=int, help="Override the abstract length (payload size)")
+    parser.add_argument("--json", dest="json_out", help="Write the full report to this path")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    overrides = {field: value for flag, field in OVERRIDES.items() if (value := getattr(args, flag)) is not None}
+    report = []
+    for name in args.scenarios.split(","):
+        if name not in SCENARIOS:
+            parser.error(f"Unknown scenario: {name}")
+        result = run_scenario(cfg, name, args.timeout, overrides)
+        report.append(result)
+        logger.info(
+            "%-10s exit=%s %6.1fs  recovered arxiv=%s openreview=%s hf=%s",
+            name,
+            result["returncode"],
+            result["seconds"],
+            result["recovered"]["arxiv_candidates"],
+            result["recovered"]["openreview_candidates"],
+            result["recovered"]["hf_hits_count"],
+        )
+        for api, summary in result["upstream"].items():
+            logger.info(
+                "%12s %4d req (%d err, %d 429)  p50 %.0fms  p95 %.0fms  p99 %.0fms  max %.0fms",
+                api,
+                summary["requests"],
+                summary["errors"],
+                summary["throttled"],
+                summary["p50_ms"],
+                summary["p95_ms"],
+                summary["p99_ms"],
+                summary["max_ms"],
+            )
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Local mock upstreams for load testing."""
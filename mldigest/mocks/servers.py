@@ -0,0 +1,274 @@
+"""In-process HTTP server imitating the arXiv, Hugging Face and OpenReview APIs.
+
+Every response goes through a :class:`Scenario` that injects latency, 5xx
+errors and 429 throttling, so ingestion can be exercised against slow or
+flaky upstreams without touching the network.
+"""
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+WORDS = (
+    "language model transformer reasoning alignment retrieval rerank embedding agent tool planning "
+    "inference latency throughput memory serving quantization kernel policy reinforcement diffusion "
+    "graph vision benchmark dataset training optimization sparse attention token cache decoding robust"
+).split()
+
+
+@dataclass
+class Scenario:
+    name: str
+    latency_median_ms: float = 20.0
+    # Log-normal spread of the latency distribution (0 = constant latency).
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    papers_per_category: int = 300
+    abstract_words: int = 150
+    hf_items: int = 50
+    openreview_notes: int = 500
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "baseline": Scenario("baseline"),
+    "slow": Scenario("slow", latency_median_ms=800, latency_sigma=0.8),
+    "flaky": Scenario("flaky", error_rate=0.2),
+    "throttled": Scenario("throttled", throttle_rate=0.3, retry_after_seconds=0.5),
+    "heavy": Scenario("heavy", papers_per_category=2000, abstract_words=600, openreview_notes=3000),
+}
+
+
+@dataclass
+class RequestRecord:
+    api: str
+    status: int
+    seconds: float
+    bytes: int
+
+
+class MockDataset:
+    """Deterministic papers spread evenly over the window ending at ``now``."""
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        categories: List[str],
+        venues: List[str],
+        window_days: int,
+        seed: int = 0,
+    ):
+        rng = random.Random(seed)
+        now = datetime.now(timezone.utc)
+        self.arxiv: list[dict] = []
+        serial = 0
+        for cat_index, category in enumerate(categories):
+            for _ in range(scenario.papers_per_category):
+                serial += 1
+                published = now - timedelta(seconds=rng.uniform(0, window_days * 86400 - 3600))
+                cross_list = categories[(cat_index + 1) % len(categories)] if serial % 10 == 0 else None
+                self.arxiv.append(
+                    {
+                        "id": f"{published:%y%m}.{serial:05d}",
+                        "title": " ".join(rng.choices(WORDS, k=8)),
+                        "abstract": " ".join(rng.choices(WORDS, k=scenario.abstract_words)),
+                        "published": published,
+                        "categories": [category] + ([cross_list] if cross_list else []),
+                        "authors": [f"Author {rng.randint(1, 500)}" for _ in range(rng.randint(1, 6))],
+                    }
+                )
+        self.arxiv.sort(key=lambda item: item["published"], reverse=True)
+        self.hf = [
+            {"arxiv_id": item["id"], "title": item["title"]}
+            for item in rng.sample(self.arxiv, min(scenario.hf_items, len(self.arxiv)))
+        ]
+        self.notes: dict[str, list[dict]] = {}
+        for venue in venues:
+            self.notes[venue] = [
+                {
+                    "id": f"{abs(hash(venue)) % 10000}-{index}",
+                    "forum": f"{abs(hash(venue)) % 10000}-{index}",
+                    "pdate": int((now - timedelta(days=rng.uniform(0, 120))).timestamp() * 1000),
+                    "content": {
+                        "title": {"value": " ".join(rng.choices(WORDS, k=8))},
+                        "authors": {"value": [f"Author {rng.randint(1, 500)}"]},
+                        "abstract": {"value": " ".join(rng.choices(WORDS, k=scenario.abstract_words))},
+                        "venueid": {"value": venue},
+                    },
+                    "_rating": round(rng.uniform(3, 8), 2),
+                }
+                for index in range(scenario.openreview_notes)
+            ]
+        self._notes_by_id = {note["id"]: note for notes in self.notes.values() for note in notes}
+
+    def expected_counts(self, categories: List[str], max_results: int) -> dict:
+        arxiv_ids: set[str] = set()
+        for category in categories:
+            matching = [item["id"] for item in self.arxiv if category in item["categories"]]
+            arxiv_ids.update(matching[:max_results])
+        return {
+            "arxiv_candidates": len(arxiv_ids),
+            "openreview_candidates": sum(len(notes) for notes in self.notes.values()),
+            "hf_hits_count": len({item["arxiv_id"] for item in self.hf}),
+        }
+
+    def arxiv_feed(self, query: str, start: int, max_results: int) -> str:
+        categories = set(re.findall(r"cat:([\w.\-]+)", query))
+        date_range = re.search(r"submittedDate:\[(\d{12}) TO (\d{12})\]", query)
+        lower = upper = None
+        if date_range:
+            lower, upper = (
+                datetime.strptime(value, "%Y%m%d%H%M").replace(tzinfo=timezone.utc) for value in date_range.groups()
+            )
+        matching = [
+            item
+            for item in self.arxiv
+            if categories.intersection(item["categories"])
+            and (lower is None or lower <= item["published"] <= upper + timedelta(minutes=1))
+        ]
+        entries = []
+        for item in matching[start : start + max_results]:
+            authors = "".join(f"<author><name>{escape(name)}</name></author>" for name in item["authors"])
+            tags = "".join(f'<category term="{escape(cat)}"/>' for cat in item["categories"])
+            entries.append(
+                f"<entry><id>http://arxiv.org/abs/{item['id']}v1</id>"
+                f"<published>{item['published']:%Y-%m-%dT%H:%M:%SZ}</published>"
+                f"<title>{escape(item['title'])}</title><summary>{escape(item['abstract'])}</summary>{authors}"
+                f'<link href="http://arxiv.org/abs/{item["id"]}v1" rel="alternate" type="text/html"/>'
+                f'<link href="http://arxiv.org/pdf/{item["id"]}v1" rel="related" type="application/pdf"/>'
+                f"{tags}</entry>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            + "".join(entries)
+            + "</feed>"
+        )
+
+    @staticmethod
+    def _decision_note(note: dict) -> dict:
+        return {
+            "id": f"{note['id']}-decision",
+            "forum": note["forum"],
+            "content": {"decision": {"value": "Accept (Poster)"}, "mean_rating": {"value": note["_rating"]}},
+        }
+
+    def openreview_notes(self, params: dict) -> dict:
+        if "forum" in params:
+            note = self._notes_by_id.get(params["forum"])
+            return {"notes": [self._decision_note(note)] if note else []}
+        venue, _, kind = (params.get("content.venueid") or params.get("invitation", "")).partition("/-/")
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 1000))
+        page = self.notes.get(venue, [])[offset : offset + limit]
+        if kind == "Decision":
+            return {"notes": [self._decision_note(note) for note in page]}
+        return {"notes": [{key: value for key, value in note.items() if key != "_rating"} for note in page]}
+
+
+class MockUpstream:
+    """One local HTTP server exposing ``/arxiv``, ``/hf`` and ``/openreview`` routes."""
+
+    def __init__(self, scenario: Scenario, dataset: MockDataset, seed: int = 0):
+        self.scenario = scenario
+        self.dataset = dataset
+        self.records: list[RequestRecord] = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _draw(self) -> tuple[float, float]:
+        with self._lock:
+            latency = self.scenario.latency_median_ms / 1000.0
+            if self.scenario.latency_sigma > 0:
+                latency *= math.exp(self._rng.gauss(0.0, self.scenario.latency_sigma))
+            return latency, self._rng.random()
+
+    def _record(self, record: RequestRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                return
+
+            def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                started = time.perf_counter()
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                api = url.path.strip("/").split("/")[0]
+                latency, roll = upstream._draw()
+                time.sleep(latency)
+                scenario = upstream.scenario
+                if roll < scenario.throttle_rate:
+                    status, body, content_type = 429, b"rate limited", "text/plain"
+                    headers = {"Retry-After": str(scenario.retry_after_seconds)}
+                elif roll < scenario.throttle_rate + scenario.error_rate:
+                    status, body, content_type, headers = 500, b"injected failure", "text/plain", {}
+                elif api == "arxiv":
+                    feed = upstream.dataset.arxiv_feed(
+                        params.get("search_query", ""),
+                        int(params.get("start", 0)),
+                        int(params.get("max_results", 10)),
+                    )
+                    status, body, content_type, headers = 200, feed.encode("utf-8"), "application/atom+xml", {}
+                elif api == "hf":
+                    body = json.dumps(upstream.dataset.hf).encode("utf-8")
+                    status, content_type, headers = 200, "application/json", {}
+                elif api == "openreview":
+                    body = json.dumps(upstream.dataset.openreview_notes(params)).encode("utf-8")
+                    status, content_type, headers = 200, "application/json", {}
+                else:
+                    status, body, content_type, headers = 404, b"not found", "text/plain", {}
+                self._send(status, body, content_type, headers)
+                upstream._record(RequestRecord(api, status, time.perf_counter() - started, len(body)))
+
+        return Handler
+
+    def start(self) -> Dict[str, str]:
+        """Start serving on a free local port and return the base URL per source."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        root = f"http://127.0.0.1:{self._server.server_address[1]}"
+        return {
+            "arxiv": f"{root}/arxiv/api/query",
+            "hf": f"{root}/hf/api/daily_papers",
+            "openreview": f"{root}/openreview",
+        }
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockUpstream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
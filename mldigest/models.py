@@ -1,7 +1,7 @@
 """Shared data models."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Dict, List, Optional
 
 
@@ -31,3 +31,10 @@ class Paper:
         for key, value in other.signals.items():
             if key not in self.signals:
                 self.signals[key] = value
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "Paper":
+        return cls(**data)
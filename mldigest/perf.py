@@ -0,0 +1,78 @@
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+from mldigest.config import load_config
+from mldigest.storage.perf_history import default_history_path, find_regressions, load_history, to_openmetrics
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def _format_labels(labels: dict) -> str:
+    return ",".join(f"{key}={value}" for key, value in labels.items())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect the per-run performance history")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write the history as an OpenMetrics textfile")
+    export.add_argument("--out", help="Output path (default: stdout)")
+    export.add_argument(
+        "--all",
+        dest="all_runs",
+        action="store_true",
+        help="Export every run as timestamped samples instead of only the latest run",
+    )
+
+    compare = commands.add_parser("compare", help="Flag metrics of the latest run that regressed")
+    compare.add_argument("--baseline", type=int, default=7, help="Number of earlier runs in the rolling baseline")
+    compare.add_argument(
+        "--threshold", type=float, default=0.3, help="Relative increase over the baseline median to flag"
+    )
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    history = load_history(default_history_path(cfg))
+    if not history:
+        logger.warning("No performance history at %s", default_history_path(cfg))
+        return
+
+    if args.command == "export":
+        text = to_openmetrics(history if args.all_runs else history[-1:], timestamps=args.all_runs)
+        if args.out:
+            out_path = Path(args.out)
+            tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            tmp_path.replace(out_path)
+        else:
+            sys.stdout.write(text)
+        return
+
+    regressions = find_regressions(history, baseline_runs=args.baseline, threshold=args.threshold)
+    latest = history[-1]
+    logger.info(
+        "Run %s (%.1fs) against %d earlier runs",
+        latest["timestamp"],
+        latest["total_seconds"],
+        min(args.baseline, len(history) - 1),
+    )
+    for item in regressions:
+        logger.warning(
+            "REGRESSION %s{%s}: %s vs baseline %s (x%s over %d runs)",
+            item["metric"],
+            _format_labels(item["labels"]),
+            item["value"],
+            item["baseline"],
+            item["ratio"],
+            item["baseline_runs"],
+        )
+    if regressions:
+        sys.exit(1)
+    logger.info("No regressions above %.0f%%", args.threshold * 100)
+
+
+if __name__ == "__main__":
+    main()
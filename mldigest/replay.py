@@ -0,0 +1,108 @@
+from __future__ import annotations
+import argparse
+import json
+import time
+from pathlib import Path
+from mldigest.config import load_config
+from mldigest.delivery.smtp_sender import send_email
+from mldigest.models import Paper
+from mldigest.report.render import render_digest
+from mldigest.storage.artifacts import write_artifacts
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def _latest_artifact(runs_dir: str) -> Path | None:
+    artifacts = sorted(Path(runs_dir).glob("digest_*.json"), key=lambda path: path.stat().st_mtime)
+    return artifacts[-1] if artifacts else None
+
+
+def _load_artifact(path: Path) -> tuple[dict, list[Paper]]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return payload, [Paper.from_dict(item) for item in payload.get("selected", [])]
+
+
+def _render(payload: dict, papers: list[Paper], subject: str) -> tuple[str, str]:
+    context = {
+        "subject": subject,
+        "window_start": payload.get("window_start"),
+        "window_end": payload.get("window_end"),
+        "momentum": payload.get("momentum") or [],
+    }
+    return render_digest(papers, context=context, templates_dir=Path(__file__).parent / "report" / "templates")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-render or re-send a stored digest without re-running the pipeline"
+    )
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument(
+        "--artifact", help="digest_*.json written by mldigest.run (default: the newest one in runs_dir)"
+    )
+    parser.add_argument("--subject", help="Replace the stored subject line")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("render", help="Render the stored selection with the current templates into new artifacts")
+
+    send = commands.add_parser("send", help="Email the stored digest")
+    send.add_argument("--to", action="append", help="Recipient (repeatable; default: email.to_addresses)")
+    send.add_argument(
+        "--render",
+        action="store_true",
+        help="Render with the current templates first instead of sending the stored bodies",
+    )
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    runs_dir = cfg["storage"]["runs_dir"]
+    artifact = Path(args.artifact) if args.artifact else _latest_artifact(runs_dir)
+    if artifact is None or not artifact.exists():
+        parser.error("No digest artifact found; run mldigest.run first or pass --artifact")
+
+    started = time.perf_counter()
+    payload, papers = _load_artifact(artifact)
+    subject = args.subject or payload.get("subject")
+    if not subject:
+        parser.error(f"{artifact} predates stored subjects; pass --subject")
+    rerender = args.command == "render" or args.render
+    if rerender and "listing" in payload:
+        parser.error(
+            "Full-listing digests need every in-window candidate; re-run mldigest.run --resume --full-listing instead"
+        )
+
+    if rerender:
+        html, text = _render(payload, papers, subject)
+        paths = write_artifacts(
+            runs_dir, papers, html, text, {**payload, "subject": subject, "rendered_from": str(artifact)}
+        )
+        logger.info(
+            "Rendered %d papers from %s in %.1f ms: %s",
+            len(papers),
+            artifact,
+            (time.perf_counter() - started) * 1000,
+            paths,
+        )
+    else:
+        html = artifact.with_suffix(".html").read_text(encoding="utf-8")
+        text = artifact.with_suffix(".txt").read_text(encoding="utf-8")
+
+    if args.command == "send":
+        email = cfg["email"]
+        send_email(
+            subject=subject,
+            sender_name=email["from_name"],
+            sender_address=email["from_address"],
+            to_addresses=args.to or email["to_addresses"],
+            html_body=html,
+            text_body=text,
+            smtp_host=email["smtp_host"],
+            smtp_port=int(email["smtp_port"]),
+            use_tls=email["use_tls"],
+        )
+        logger.info("Email sent: %s (%d papers from %s)", subject, len(papers), artifact)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,122 @@
 """Render digest templates."""
 from __future__ import annotations
 
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from mldigest.models import Paper
 
+# Room left under the email cap for the closing tags and truncation notice.
+FOOTER_RESERVE_BYTES = 2048
 
-def render_digest(papers: List[Paper], context: dict, templates_dir: Path) -> tuple[str, str]:
-    env = Environment(
+
+def _environment(templates_dir: Path) -> Environment:
+    return Environment(
         loader=FileSystemLoader(str(templates_dir)),
         autoescape=select_autoescape(["html", "xml"]),
     )
+
+
+def render_digest(papers: List[Paper], context: dict, templates_dir: Path) -> tuple[str, str]:
+    env = _environment(templates_dir)
     html_template = env.get_template("digest.html.j2")
     text_template = env.get_template("digest.txt.j2")
     html = html_template.render(papers=papers, **context)
     text = text_template.render(papers=papers, **context)
     return html, text
+
+
+class ByteBudget:
+    """Output size tracker shared between the render loop and the paper iterators."""
+
+    def __init__(self, cap: Optional[int] = None):
+        self.cap = cap
+        self.used = 0
+        self.items = 0
+        self.truncated = False
+
+    @property
+    def exhausted(self) -> bool:
+        return self.cap is not None and self.used >= self.cap - FOOTER_RESERVE_BYTES
+
+
+def group_by_topic(papers: Iterable[Paper]) -> Dict[str, List[Paper]]:
+    groups: dict[str, list[Paper]] = {}
+    for paper in papers:
+        for topic in paper.topics or ["Other"]:
+            groups.setdefault(topic, []).append(paper)
+    return groups
+
+
+def _capped(papers: Iterable[Paper], budget: ByteBudget) -> Iterator[Paper]:
+    for paper in papers:
+        if budget.exhausted:
+            budget.truncated = True
+            return
+        budget.items += 1
+        yield paper
+
+
+def _capped_groups(groups: Dict[str, List[Paper]], budget: ByteBudget) -> Iterator[tuple[str, Iterator[Paper]]]:
+    for topic, papers in groups.items():
+        if budget.exhausted:
+            budget.truncated = True
+            return
+        yield topic, _capped(papers, budget)
+
+
+def stream_listing(
+    papers: List[Paper],
+    selected: List[Paper],
+    context: dict,
+    templates_dir: Path,
+    paths: Dict[str, Path],
+    email_max_bytes: int,
+    full_listing_urls: Dict[str, str],
+) -> tuple[str, str, dict]:
+    """Render the full topic listing straight to ``paths`` with ``Template.generate``.
+
+    Returns size-capped HTML and text email bodies that end with a link to the
+    full artifact when truncated, plus per-format throughput figures.
+    """
+    env = _environment(templates_dir)
+    groups = group_by_topic(papers)
+    bodies: dict[str, str] = {}
+    stats: dict[str, dict] = {}
+    for fmt, template_name in (("html", "listing.html.j2"), ("text", "listing.txt.j2")):
+        template = env.get_template(template_name)
+        started = time.perf_counter()
+        written = 0
+        with paths[fmt].open("w", encoding="utf-8") as handle:
+            for chunk in template.generate(
+                groups=groups.items(), selected=selected, total=len(papers), budget=ByteBudget(), **context
+            ):
+                handle.write(chunk)
+                written += len(chunk)
+        elapsed = time.perf_counter() - started
+
+        budget = ByteBudget(email_max_bytes)
+        parts = []
+        for chunk in template.generate(
+            groups=_capped_groups(groups, budget),
+            selected=selected,
+            total=len(papers),
+            budget=budget,
+            full_listing_url=full_listing_urls[fmt],
+            **context,
+        ):
+            parts.append(chunk)
+            budget.used += len(chunk.encode("utf-8"))
+        bodies[fmt] = "".join(parts)
+        stats[fmt] = {
+            "path": str(paths[fmt]),
+            "chars": written,
+            "seconds": round(elapsed, 4),
+            "papers_per_second": round(len(papers) / elapsed, 1) if elapsed else None,
+            "email_bytes": budget.used,
+            "email_truncated": budget.truncated,
+        }
+    return bodies["html"], bodies["text"], stats
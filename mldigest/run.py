@@ -1,20 +1,35 @@
 from __future__ import annotations
 import argparse
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from mldigest.config import load_config, masked_config
 from mldigest.delivery.smtp_sender import send_email
-from mldigest.ingest.arxiv_client import fetch_arxiv_papers
-from mldigest.ingest.hf_client import fetch_hf_hits
-from mldigest.ingest.openreview_client import fetch_openreview_papers
+from mldigest.ingest.arxiv_client import ARXIV_API, configure_rate_limit, fetch_arxiv_papers
+from mldigest.ingest.arxiv_client import REQUEST_INTERVAL as ARXIV_REQUEST_INTERVAL
+from mldigest.ingest.hf_client import HF_ENDPOINT, fetch_hf_hits
+from mldigest.ingest.openreview_client import OPENREVIEW_API, enrich_decisions, fetch_openreview_papers
+from mldigest.ingest.openreview_client import prefetch_decisions
 from mldigest.models import Paper
-from mldigest.report.render import render_digest
-from mldigest.selector.orchestrator import orchestrate_selection
-from mldigest.storage.artifacts import write_artifacts
-from mldigest.utils import get_logger, window_bounds
+from mldigest.report.render import render_digest, stream_listing
+from mldigest.selector.orchestrator import enrich_candidates, merge_papers, score_candidates, select_papers
+from mldigest.signals.authors import followed_author_keys
+from mldigest.signals.parallel import benchmark as benchmark_signals
+from mldigest.storage.artifacts import listing_paths, new_artifact_base, write_artifacts
+from mldigest.storage.author_index import AuthorIndex, default_author_index_path
+from mldigest.storage.checkpoints import StageCheckpoints, decode_candidates, encode_candidates, fingerprint
+from mldigest.storage.perf_history import append_run, default_history_path, find_regressions, load_history
+from mldigest.storage.search_index import SearchIndex, default_index_path, exploration_relevance
+from mldigest.storage.topic_rollups import TopicRollups, default_rollup_path
+from mldigest.utils import filter_by_window, get_logger, request_stats, window_bounds
 
 logger = get_logger(__name__)
 
+# Per-venue OpenReview figures kept in the perf history; peak_memory_bytes only with --trace-memory.
+OPENREVIEW_PERF_KEYS = ("notes", "papers", "pages", "bytes", "peak_memory_bytes")
+
+
 def _apply_keyphrases(papers: list[Paper], enable: bool) -> None:
     if not enable:
         return
@@ -37,67 +52,394 @@ def _print_summary(papers: list[Paper]) -> None:
         logger.info("[%s] %s", paper.signals.get("role"), paper.title)
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Weekly ML / AI paper digest generator")
-    parser.add_argument("--config", required=True, help="Path to config YAML")
-    parser.add_argument("--dry-run", action="store_true", help="Skip email delivery")
-    parser.add_argument("--print", dest="print_out", action="store_true", help="Print summary to stdout")
-    args = parser.parse_args()
-
-    cfg = load_config(args.config).data
-    schedule = cfg["schedule"]
-    window_days = int(schedule["window_days"])
-    window_start, window_end = window_bounds(window_days)
-
+def _ingest(
+    cfg: dict, window_days: int, index: SearchIndex, authors: AuthorIndex, trace_memory: bool = False
+) -> dict:
+    sources = cfg["sources"]
     arxiv_papers: list[Paper] = []
-    if cfg["sources"]["arxiv"]["enabled"]:
+    if sources["arxiv"]["enabled"]:
+        configure_rate_limit(float(sources["arxiv"].get("request_interval", ARXIV_REQUEST_INTERVAL)))
         arxiv_papers = fetch_arxiv_papers(
-            cfg["sources"]["arxiv"]["categories"],
+            sources["arxiv"]["categories"],
             start=0,
             max_results=cfg["limits"]["arxiv_max_results"],
             window_days=window_days,
+            base_url=sources["arxiv"].get("base_url") or ARXIV_API,
         )
 
     hf_hits = {}
-    if cfg["sources"]["hf"]["enabled"]:
-        hf_month = cfg["sources"]["hf"].get("month") or datetime.now().strftime("%Y-%m")
-        hf_hits = fetch_hf_hits(hf_month)
+    if sources["hf"]["enabled"]:
+        hf_month = sources["hf"].get("month") or datetime.now().strftime("%Y-%m")
+        hf_hits = fetch_hf_hits(hf_month, base_url=sources["hf"].get("base_url") or HF_ENDPOINT)
 
     openreview_papers: list[Paper] = []
-    if cfg["sources"]["openreview"]["enabled"]:
+    openreview_stats: dict = {}
+    if sources["openreview"]["enabled"]:
         openreview_papers = fetch_openreview_papers(
-            cfg["sources"]["openreview"]["venues"],
-            accept_only=cfg["sources"]["openreview"]["accept_only"],
+            sources["openreview"]["venues"],
+            accept_only=sources["openreview"]["accept_only"],
+            stats=openreview_stats,
+            base_url=sources["openreview"].get("base_url") or OPENREVIEW_API,
+            lookup_decisions=False,
+            trace_memory=trace_memory,
         )
 
-    selected, scoring_debug = orchestrate_selection(arxiv_papers, openreview_papers, hf_hits, cfg)
-    _apply_keyphrases(selected, cfg["limits"]["enable_keyphrases"])
+    indexed = index.add_papers(arxiv_papers + openreview_papers)
+    logger.info("Search index: %d papers added, %d total", indexed, len(index))
+    authors.add_papers(arxiv_papers + openreview_papers)
+    return {
+        "arxiv": arxiv_papers,
+        "openreview": openreview_papers,
+        "hf_hits": hf_hits,
+        "openreview_stats": openreview_stats,
+    }
 
-    subject = f"{cfg['email']['subject_prefix']} — {datetime.now().strftime('%Y-%m')} — {len(selected)} papers"
-    context = {
-        "subject": subject,
-        "window_start": window_start.isoformat(),
-        "window_end": window_end.isoformat(),
+
+def _encode_ingest(data: dict) -> dict:
+    return {
+        **data,
+        "arxiv": [paper.to_dict() for paper in data["arxiv"]],
+        "openreview": [paper.to_dict() for paper in data["openreview"]],
+    }
+
+
+def _decode_ingest(data: dict) -> dict:
+    return {
+        **data,
+        "arxiv": [Paper.from_dict(item) for item in data["arxiv"]],
+        "openreview": [Paper.from_dict(item) for item in data["openreview"]],
     }
-    html, text = render_digest(
-        selected,
-        context=context,
-        templates_dir=Path(__file__).parent / "report" / "templates",
+
+
+def _update_rollups(cfg: dict, candidates: list[Paper], as_of: str) -> list[dict]:
+    started = time.perf_counter()
+    momentum_cfg = (cfg.get("report") or {}).get("momentum") or {}
+    with TopicRollups(default_rollup_path(cfg)) as rollups:
+        recomputed = rollups.sync_buckets(cfg["topics"]["buckets"])
+        updated = rollups.add_papers(candidates, accept_only=cfg["sources"]["openreview"]["accept_only"])
+        momentum = rollups.momentum(
+            datetime.fromisoformat(as_of).date(),
+            recent_days=int(momentum_cfg.get("recent_days", 7)),
+            baseline_days=int(momentum_cfg.get("baseline_days", 28)),
+        )
+        tracked = len(rollups)
+    logger.info(
+        "Topic rollups: %d papers updated, %s recomputed, %d papers tracked in %.2fs",
+        updated,
+        ", ".join(recomputed) or "no topics",
+        tracked,
+        time.perf_counter() - started,
     )
+    return momentum
+
+
+def _templates_fingerprint(templates_dir: Path) -> str:
+    return fingerprint(*[path.read_text(encoding="utf-8") for path in sorted(templates_dir.glob("*.j2"))])
+
+
+def _artifact_url(path: Path, base_url: str | None) -> str:
+    if base_url:
+        return f"{base_url.rstrip('/')}/{path.name}"
+    return path.resolve().as_uri()
+
+
+def _record_perf(
+    cfg: dict,
+    run_key: str,
+    timings: dict,
+    deliver_seconds: float,
+    total_seconds: float,
+    selection: dict,
+    resume: bool,
+    dry_run: bool,
+) -> None:
+    history_path = default_history_path(cfg)
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "run_key": run_key,
+        "resume": resume,
+        "dry_run": dry_run,
+        "total_seconds": round(total_seconds, 4),
+        "stages": {**timings, "deliver": {"seconds": round(deliver_seconds, 4), "resumed": False}},
+        "requests": request_stats(),
+        "signals": {}
+        if timings.get("scored", {}).get("resumed")
+        else selection["scoring_debug"].get("signals", {}).get("timings", {}),
+        "openreview": {
+            venue: {key: stats[key] for key in OPENREVIEW_PERF_KEYS if key in stats}
+            for venue, stats in selection["openreview_stats"].items()
+        },
+        "counts": selection["counts"],
+    }
+    history = load_history(history_path)
+    append_run(history_path, record)
+    for item in find_regressions(history, latest=record):
+        logger.warning(
+            "Slower than the last %d runs: %s %s = %s (baseline %s)",
+            item["baseline_runs"],
+            item["metric"],
+            item["labels"],
+            item["value"],
+            item["baseline"],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Weekly ML / AI paper digest generator")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument("--dry-run", action="store_true", help="Skip email delivery")
+    parser.add_argument("--print", dest="print_out", action="store_true", help="Print summary to stdout")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse checkpointed stages of today's run whose inputs have not changed",
+    )
+    parser.add_argument(
+        "--full-listing",
+        action="store_true",
+        help="List every in-window candidate grouped by topic (overrides report.mode)",
+    )
+    parser.add_argument(
+        "--benchmark-signals",
+        metavar="WORKERS",
+        help="Comma-separated worker counts to benchmark signal computation on this run's candidates",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Record peak memory while OpenReview notes are parsed (tracemalloc; slows ingest down)",
+    )
+    args = parser.parse_args()
+    started = time.perf_counter()
+
+    cfg = load_config(args.config).data
+    schedule = cfg["schedule"]
+    window_days = int(schedule["window_days"])
+    templates_dir = Path(__file__).parent / "report" / "templates"
+
+    run_key = f"{datetime.now(timezone.utc).strftime('%Y%m%d')}_w{window_days}"
+    checkpoints = StageCheckpoints(cfg["storage"]["runs_dir"], run_key, resume=args.resume)
+    keys = {"window": fingerprint(run_key)}
+    keys["ingest"] = fingerprint(keys["window"], cfg["sources"], cfg["limits"]["arxiv_max_results"])
+    keys["merged"] = fingerprint(keys["ingest"])
+    followed_names = (cfg["selection_strategy"].get("followed_authors") or {}).get("names") or []
+    keys["scored"] = fingerprint(keys["merged"], cfg["topics"], followed_names)
+    keys["enriched"] = fingerprint(keys["scored"], cfg["selection_strategy"], cfg["limits"])
+    keys["selection"] = fingerprint(keys["enriched"])
+    report_cfg = cfg.get("report") or {}
+    full_listing = args.full_listing or report_cfg.get("mode") == "full_listing"
+    keys["rendered"] = fingerprint(
+        keys["selection"],
+        cfg["email"]["subject_prefix"],
+        _templates_fingerprint(templates_dir),
+        report_cfg,
+        full_listing,
+    )
+    artifact_base = new_artifact_base(cfg["storage"]["runs_dir"])
+
+    window = checkpoints.stage(
+        "window",
+        keys["window"],
+        lambda: [bound.isoformat() for bound in window_bounds(window_days)],
+    )
+    window_start, window_end = window
+
+    with SearchIndex(default_index_path(cfg)) as index, AuthorIndex(default_author_index_path(cfg)) as authors:
+
+        @lru_cache(maxsize=None)
+        def ingested() -> dict:
+            return checkpoints.stage(
+                "ingest",
+                keys["ingest"],
+                lambda: _ingest(cfg, window_days, index, authors, trace_memory=args.trace_memory),
+                encode=_encode_ingest,
+                decode=_decode_ingest,
+            )
+
+        @lru_cache(maxsize=None)
+        def merged() -> tuple:
+            def compute() -> tuple:
+                data = ingested()
+                return merge_papers(data["arxiv"], data["openreview"]), data["openreview"]
+
+            return checkpoints.stage(
+                "merged",
+                keys["merged"],
+                compute,
+                encode=lambda pool: encode_candidates(*pool),
+                decode=decode_candidates,
+            )
+
+        @lru_cache(maxsize=None)
+        def scored() -> tuple:
+            def compute() -> tuple:
+                candidates, openreview_papers = merged()
+                signal_stats = score_candidates(candidates, ingested()["hf_hits"], cfg)
+                return candidates, openreview_papers, signal_stats
+
+            return checkpoints.stage(
+                "scored",
+                keys["scored"],
+                compute,
+                encode=lambda pool: {**encode_candidates(pool[0], pool[1]), "signal_stats": pool[2]},
+                decode=lambda data: (*decode_candidates(data), data["signal_stats"]),
+            )
+
+        @lru_cache(maxsize=None)
+        def enriched() -> tuple:
+            def compute() -> tuple:
+                candidates, openreview_papers, signal_stats = scored()
+                screeners, enrichers = [], []
+                openreview = cfg["sources"]["openreview"]
+                if openreview["enabled"]:
+                    base_url = openreview.get("base_url") or OPENREVIEW_API
+                    # Accept-only listings are filtered server-side, so only the shortlist's ratings are missing.
+                    if not openreview["accept_only"]:
+                        screeners.append(partial(prefetch_decisions, base_url=base_url))
+                    enrichers.append(partial(enrich_decisions, base_url=base_url))
+                enrichment = enrich_candidates(
+                    candidates,
+                    ingested()["hf_hits"],
+                    cfg,
+                    relevance=exploration_relevance(cfg, candidates),
+                    screeners=screeners,
+                    enrichers=enrichers,
+                )
+                return candidates, openreview_papers, signal_stats, enrichment
+
+            return checkpoints.stage(
+                "enriched",
+                keys["enriched"],
+                compute,
+                encode=lambda pool: {
+                    **encode_candidates(pool[0], pool[1]),
+                    "signal_stats": pool[2],
+                    "enrichment": pool[3],
+                },
+                decode=lambda data: (*decode_candidates(data), data["signal_stats"], data["enrichment"]),
+            )
+
+        def select() -> dict:
+            candidates, _openreview_papers, signal_stats, enrichment = enriched()
+            hf_hits = ingested()["hf_hits"]
+            selected, scoring_debug = select_papers(
+                candidates,
+                hf_hits,
+                cfg,
+                relevance=exploration_relevance(cfg, candidates),
+                signal_stats=signal_stats,
+                enrichment=enrichment,
+            )
+            _apply_keyphrases(selected, cfg["limits"]["enable_keyphrases"])
+            index.add_papers(selected)
+            data = ingested()
+            counts = {
+                "arxiv_candidates": len(data["arxiv"]),
+                "openreview_candidates": len(data["openreview"]),
+                "hf_hits_count": len(hf_hits),
+            }
+            return {
+                "selected": selected,
+                "scoring_debug": scoring_debug,
+                "counts": counts,
+                "openreview_stats": data["openreview_stats"],
+                "momentum": _update_rollups(cfg, candidates, window_end),
+            }
+
+        if args.benchmark_signals:
+            results = benchmark_signals(
+                merged()[0],
+                ingested()["hf_hits"],
+                cfg["topics"]["buckets"],
+                window_days,
+                [int(count) for count in args.benchmark_signals.split(",")],
+                followed_authors=followed_author_keys(followed_names),
+            )
+            for result in results:
+                logger.info(
+                    "signal_workers=%d (%d used): %.2fs, speedup %.2fx (%d cores)",
+                    result["requested_workers"],
+                    result["workers"],
+                    result["seconds"],
+                    result["speedup"] or 0,
+                    result["cores"],
+                )
+
+        selection = checkpoints.stage(
+            "selection",
+            keys["selection"],
+            select,
+            encode=lambda data: {**data, "selected": [paper.to_dict() for paper in data["selected"]]},
+            decode=lambda data: {**data, "selected": [Paper.from_dict(item) for item in data["selected"]]},
+        )
+        selected = selection["selected"]
+
+        def render() -> dict:
+            subject = (
+                f"{cfg['email']['subject_prefix']} — {datetime.now().strftime('%Y-%m')} — {len(selected)} papers"
+            )
+            context = {
+                "subject": subject,
+                "window_start": window_start,
+                "window_end": window_end,
+                "momentum": selection.get("momentum") or [],
+            }
+            if not full_listing:
+                html, text = render_digest(selected, context=context, templates_dir=templates_dir)
+                return {"subject": subject, "html": html, "text": text}
+
+            in_window = [
+                paper for paper in scored()[0] if filter_by_window(paper.published_at, window_days)
+            ]
+            in_window.sort(key=lambda paper: str(paper.published_at or ""), reverse=True)
+            context["subject"] = subject = (
+                f"{cfg['email']['subject_prefix']} — {datetime.now().strftime('%Y-%m')} — "
+                f"{len(in_window)} papers (full listing)"
+            )
+            paths = listing_paths(artifact_base)
+            html, text, listing_stats = stream_listing(
+                in_window,
+                selected,
+                context,
+                templates_dir,
+                paths,
+                email_max_bytes=int(report_cfg.get("email_max_bytes", 500_000)),
+                full_listing_urls={
+                    fmt: _artifact_url(path, report_cfg.get("artifact_base_url")) for fmt, path in paths.items()
+                },
+            )
+            for fmt, stats in listing_stats.items():
+                logger.info(
+                    "Listing %s: %d papers in %.2fs (%s papers/s), email body %d bytes%s",
+                    fmt,
+                    len(in_window),
+                    stats["seconds"],
+                    stats["papers_per_second"],
+                    stats["email_bytes"],
+                    " (truncated)" if stats["email_truncated"] else "",
+                )
+            return {"subject": subject, "html": html, "text": text, "listing": listing_stats}
+
+        rendered = checkpoints.stage("rendered", keys["rendered"], render)
+    subject, html, text = rendered["subject"], rendered["html"], rendered["text"]
 
     payload = {
         "config_snapshot": masked_config(cfg),
-        "window_start": window_start.isoformat(),
-        "window_end": window_end.isoformat(),
-        "counts": {
-            "arxiv_candidates": len(arxiv_papers),
-            "openreview_candidates": len(openreview_papers),
-            "hf_hits_count": len(hf_hits),
-        },
-        "scoring_debug": scoring_debug,
+        "subject": subject,
+        "window_start": window_start,
+        "window_end": window_end,
+        "counts": selection["counts"],
+        "openreview_stats": selection["openreview_stats"],
+        "scoring_debug": selection["scoring_debug"],
+        "momentum": selection.get("momentum") or [],
     }
+    if "listing" in rendered:
+        payload["listing"] = rendered["listing"]
 
-    artifact_paths = write_artifacts(cfg["storage"]["runs_dir"], selected, html, text, payload)
+    deliver_started = time.perf_counter()
+    artifact_paths = write_artifacts(
+        cfg["storage"]["runs_dir"], selected, html, text, payload, base=artifact_base
+    )
     logger.info("Artifacts written: %s", artifact_paths)
 
     if args.print_out:
@@ -117,6 +459,17 @@ def main() -> None:
         )
         logger.info("Email sent")
 
+    _record_perf(
+        cfg,
+        run_key,
+        checkpoints.timings,
+        time.perf_counter() - deliver_started,
+        time.perf_counter() - started,
+        selection,
+        resume=args.resume,
+        dry_run=args.dry_run,
+    )
+
 
 if __name__ == "__main__":
     main()
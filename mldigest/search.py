@@ -0,0 +1,35 @@
+from __future__ import annotations
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from mldigest.config import load_config
+from mldigest.storage.search_index import SearchIndex, default_index_path
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search the local paper index with BM25")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument("query", help="Free-text query, e.g. 'speculative decoding'")
+    parser.add_argument("--days", type=int, default=None, help="Only papers published in the last N days")
+    parser.add_argument("--limit", type=int, default=20, help="Number of results")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    since = None
+    if args.days is not None:
+        since = (datetime.now(timezone.utc) - timedelta(days=args.days)).strftime("%Y-%m-%d")
+
+    with SearchIndex(default_index_path(cfg)) as index:
+        started = time.perf_counter()
+        hits = index.search(args.query, limit=args.limit, since=since)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for rank, (paper_id, title, published_at, score) in enumerate(hits, start=1):
+            print(f"{rank:>3}. {score:7.3f}  {(published_at or '')[:10]}  {paper_id}  {title}")
+        logger.info("%d hits over %d papers in %.1f ms", len(hits), len(index), elapsed_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Heap-based greedy fill of ``limits.papers_per_cycle`` slots under ``limits.per_topic_cap``.
+
+Each source of candidates (trending, quality, exploration and the fallbacks)
+is a max-heap built once from precomputed scores. A slot pops its role's
+heaps until a candidate is neither a duplicate of a selected paper nor in a
+primary topic that already reached its cap; rejected candidates can never
+become valid again (the selection only grows), so every paper is popped at
+most once per heap. The cheap topic-cap test runs inside ``pop`` so capped
+entries are dropped before any fuzzy title match or similarity rescoring.
+
+Exploration scores include a diversity term that only shrinks as papers are
+selected, so that heap uses lazy re-evaluation: a popped candidate whose
+score is stale is rescored against the new picks and pushed back, and is
+accepted once its fresh score still beats the best remaining bound.
+
+:func:`fill_slots` is the fill loop itself, shared by the selector and the
+weight sweep so both apply the same fallback chains, cap and duplicate rules.
+If the cap alone leaves slots empty (most candidates share a primary topic),
+it is raised one step at a time and the empty slots are retried from fresh
+heaps, so a lopsided window still fills every slot it has candidates for.
+"""
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from itertools import cycle, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from mldigest.models import Paper
+from mldigest.utils import fuzzy_title_match
+
+ROLES = ("trending", "quality", "exploration")
+
+
+class ScoreHeap:
+    """Max-heap over ``(score, paper)``; ties go to the earlier candidate like a stable sort."""
+
+    def __init__(self, scored: Iterable[Tuple[float, Paper]]):
+        self.heap = [(-score, order, paper) for order, (score, paper) in enumerate(scored)]
+        heapq.heapify(self.heap)
+
+    def pop(self, capped: Callable[[Paper], bool]) -> Optional[Paper]:
+        while self.heap:
+            paper = heapq.heappop(self.heap)[2]
+            if not capped(paper):
+                return paper
+        return None
+
+    def top(self, k: int) -> List[Tuple[float, Paper]]:
+        return [(-score, paper) for score, _, paper in heapq.nsmallest(k, self.heap)]
+
+
+class RankedScores:
+    """Pops ``papers`` by descending ``scores`` (stable), sorting only if the best one is rejected.
+
+    Most slots accept the first candidate, so a single ``argmax`` is usually
+    all the work; ``order`` can pass in a precomputed stable descending order
+    (or a subset of one). Entries scored ``-inf`` are never popped.
+    """
+
+    def __init__(self, papers: Sequence[Paper], scores: Optional[np.ndarray], order: Optional[np.ndarray] = None):
+        self.papers = papers
+        self.scores = scores
+        self.order = order
+        self.popped = 0
+
+    def _next(self) -> Optional[int]:
+        if self.popped == 0 and self.order is None and len(self.papers):
+            index = int(np.argmax(self.scores))
+        else:
+            if self.order is None:
+                self.order = np.argsort(-self.scores, kind="stable")
+            if self.popped >= len(self.order):
+                return None
+            index = int(self.order[self.popped])
+        self.popped += 1
+        if self.scores is not None and self.scores[index] == -np.inf:
+            return None
+        return index
+
+    def pop(self, capped: Callable[[Paper], bool]) -> Optional[Paper]:
+        while (index := self._next()) is not None:
+            if not capped(self.papers[index]):
+                return self.papers[index]
+        return None
+
+
+class DiversityHeap:
+    """Lazy-greedy heap for ``base + weight * (1 - max cosine similarity to the selection)``."""
+
+    def __init__(
+        self,
+        papers: List[Paper],
+        base: np.ndarray,
+        vectors: sparse.csr_matrix,
+        selected_vectors: Callable[[], Optional[sparse.csr_matrix]],
+        weight: float,
+    ):
+        self.papers = papers
+        self.base = base
+        self.vectors = vectors
+        self.selected_vectors = selected_vectors
+        self.weight = weight
+        self.similarity = np.zeros(len(papers))
+        chosen = selected_vectors()
+        if chosen is not None and len(papers):
+            self.similarity = (vectors @ chosen.T).max(axis=1).toarray().ravel()
+        self.stamp = 0 if chosen is None else chosen.shape[0]
+        scores = base + weight * (1.0 - self.similarity)
+        for paper, score, similarity in zip(papers, scores, self.similarity):
+            paper.scores["exploration"] = float(score)
+            paper.scores["exploration_similarity"] = float(similarity)
+        self.heap = [(-float(score), index, self.stamp) for index, score in enumerate(scores)]
+        heapq.heapify(self.heap)
+
+    def _rescore(self, index: int, since: int) -> float:
+        chosen = self.selected_vectors()
+        newest = (self.vectors[index] @ chosen[since:].T).toarray().max()
+        self.similarity[index] = max(self.similarity[index], float(newest))
+        score = float(self.base[index] + self.weight * (1.0 - self.similarity[index]))
+        paper = self.papers[index]
+        paper.scores["exploration"] = score
+        paper.scores["exploration_similarity"] = float(self.similarity[index])
+        return score
+
+    def pop(self, capped: Callable[[Paper], bool]) -> Optional[Paper]:
+        chosen = self.selected_vectors()
+        current = 0 if chosen is None else chosen.shape[0]
+        while self.heap:
+            _, index, stamp = heapq.heappop(self.heap)
+            if capped(self.papers[index]):
+                continue
+            if stamp == current:
+                return self.papers[index]
+            heapq.heappush(self.heap, (-self._rescore(index, stamp), index, current))
+        return None
+
+    def top(self, k: int) -> List[Tuple[float, Paper]]:
+        return [(-score, self.papers[index]) for score, index, _ in heapq.nsmallest(k, self.heap)]
+
+
+class SlotFiller:
+    """Fills ``slots`` roles in order from per-role chains of heaps."""
+
+    def __init__(self, per_topic_cap: int, vectors: sparse.csr_matrix, rows: Dict[int, int]):
+        self.per_topic_cap = per_topic_cap
+        self.vectors = vectors
+        self.rows = rows
+        self.selected: List[Paper] = []
+        self.topic_counts: Counter = Counter()
+        self.skipped = Counter()
+        self._selected_matrix: Optional[sparse.csr_matrix] = None
+
+    def selected_vectors(self) -> Optional[sparse.csr_matrix]:
+        if not self.selected:
+            return None
+        if self._selected_matrix is None or self._selected_matrix.shape[0] != len(self.selected):
+            self._selected_matrix = self.vectors[[self.rows[id(paper)] for paper in self.selected]]
+        return self._selected_matrix
+
+    def _capped(self, paper: Paper) -> bool:
+        topic = primary_topic(paper)
+        if topic is not None and self.topic_counts[topic] >= self.per_topic_cap:
+            self.skipped["topic_cap"] += 1
+            return True
+        return False
+
+    def cap_reached(self) -> bool:
+        """Whether some topic is at ``per_topic_cap``, i.e. the cap may be what rejects candidates."""
+        return any(topic is not None and count >= self.per_topic_cap for topic, count in self.topic_counts.items())
+
+    def _duplicate(self, paper: Paper) -> bool:
+        if any(paper is chosen or fuzzy_title_match(paper.title, chosen.title) for chosen in self.selected):
+            self.skipped["duplicate"] += 1
+            return True
+        return False
+
+    def take(self, sources: Iterable[Tuple[str, object]]) -> Tuple[Optional[Paper], Optional[str]]:
+        """First admissible candidate from the first non-exhausted source."""
+        for name, heap in sources:
+            while True:
+                paper = heap.pop(self._capped)
+                if paper is None:
+                    break
+                if not self._duplicate(paper):
+                    self.selected.append(paper)
+                    self.topic_counts[primary_topic(paper)] += 1
+                    return paper, name
+        return None, None
+
+
+# Fallback chain of one role: ``(source name, heap factory)`` pairs tried in order.
+SourceChain = Sequence[Tuple[str, Callable[[], object]]]
+
+
+def _chain_heaps(chain: SourceChain, heaps: Dict[str, object]) -> Iterator[Tuple[str, object]]:
+    for name, build in chain:
+        if name not in heaps:
+            heaps[name] = build()
+        yield name, heaps[name]
+
+
+def fill_slots(
+    roles: Sequence[str],
+    filler: SlotFiller,
+    chains: Dict[str, SourceChain],
+    heaps: Optional[Dict[str, object]] = None,
+) -> List[Tuple[str, Paper, str]]:
+    """Fill one slot per role from that role's chain; returns ``(role, paper, source)`` per filled slot.
+
+    Heaps are built the first time a chain reaches them (so a heap that
+    depends on earlier picks sees them) and are shared by every role that
+    names the same source. Pass ``heaps`` to inspect or pre-seed them.
+    Slots left empty while some topic is at the cap are retried with
+    ``filler.per_topic_cap`` raised by one per pass, each pass from fresh
+    heaps (earlier passes dropped the capped entries); the raised cap stays
+    on ``filler``.
+    """
+    heaps = {} if heaps is None else heaps
+    filled = []
+    empty = list(roles)
+    while True:
+        missing = []
+        for role in empty:
+            paper, source = filler.take(_chain_heaps(chains[role], heaps))
+            if paper is None:
+                missing.append(role)
+            else:
+                filled.append((role, paper, source))
+        if not missing or not filler.cap_reached():
+            return filled
+        filler.per_topic_cap += 1
+        empty, heaps = missing, {}
+
+
+def primary_topic(paper: Paper) -> Optional[str]:
+    """The topic a paper counts against for ``per_topic_cap``: its first bucket in config order."""
+    return paper.topics[0] if paper.topics else None
+
+
+def slot_roles(count: int) -> List[str]:
+    """Role of each slot: trending, quality, exploration, trending, ..."""
+    return list(islice(cycle(ROLES), count))
@@ -1,53 +1,47 @@
 """Exploration selection."""
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from mldigest.models import Paper
-from mldigest.signals.engineering import apply_engineering_signals
-from mldigest.signals.keywords import novelty_keyword_hit
-from mldigest.signals.recency import recency_score
+from mldigest.signals.keywords import paper_novelty
+from mldigest.signals.recency import paper_recency
 
 
-def score_exploration(
-    paper: Paper,
-    window_days: int,
-    weights: dict,
-    buckets: dict,
-    topic_diversity_bonus: float,
-) -> float:
-    apply_engineering_signals(paper)
-    novelty = novelty_keyword_hit(paper, buckets)
-    recency = recency_score(paper.published_at, window_days)
-    has_code = 1.0 if paper.signals.get("engineering", {}).get("has_code_link") else 0.0
-    score = (
-        weights.get("novelty_keywords", 0.4) * novelty
-        + weights.get("recency", 0.3) * recency
-        + weights.get("has_code_link", 0.2) * has_code
-        + weights.get("topic_diversity", 0.1) * topic_diversity_bonus
-    )
-    paper.scores["exploration"] = score
-    return score
+# weight name -> (feature name, default weight) for the weight-independent part of the score
+EXPLORATION_TERMS: Dict[str, Tuple[str, float]] = {
+    "novelty_keywords": ("novelty", 0.4),
+    "recency": ("recency", 0.3),
+    "has_code_link": ("has_code", 0.2),
+    "relevance": ("relevance", 0.0),
+}
 
 
-def select_exploration(
+def exploration_features(
     papers: List[Paper],
     window_days: int,
-    weights: dict,
     buckets: dict,
-    selected_topics: list[str],
-) -> Tuple[Paper | None, list[tuple[str, float, dict]]]:
-    candidates = []
-    for paper in papers:
-        topic_diversity_bonus = 0.0
-        if paper.topics:
-            if not set(paper.topics).intersection(set(selected_topics)):
-                topic_diversity_bonus = 1.0
-        score_exploration(paper, window_days, weights, buckets, topic_diversity_bonus)
-        candidates.append(paper)
-    ranked = sorted(candidates, key=lambda p: p.scores.get("exploration", 0), reverse=True)
-    debug = [
-        (p.paper_id, p.scores.get("exploration", 0), p.signals.get("engineering", {}))
-        for p in ranked[:10]
-    ]
-    return (ranked[0] if ranked else None, debug)
+    relevance: dict[str, float] | None = None,
+) -> Dict[str, np.ndarray]:
+    """Per-paper inputs of the exploration score that do not depend on the weights.
+
+    Reads the batch signals computed by :func:`mldigest.signals.parallel.compute_signals`.
+    """
+    relevance = relevance or {}
+    return {
+        "novelty": np.array([paper_novelty(paper, buckets) for paper in papers], dtype=float),
+        "recency": np.array([paper_recency(paper, window_days) for paper in papers], dtype=float),
+        "has_code": np.array(
+            [1.0 if paper.signals.get("engineering", {}).get("has_code_link") else 0.0 for paper in papers]
+        ),
+        "relevance": np.array([relevance.get(paper.paper_id, 0.0) for paper in papers], dtype=float),
+    }
+
+
+def exploration_base(features: Dict[str, np.ndarray], weights: dict) -> np.ndarray:
+    return sum(
+        weights.get(name, default) * features[feature] for name, (feature, default) in EXPLORATION_TERMS.items()
+    )
+
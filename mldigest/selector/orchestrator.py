@@ -1,16 +1,29 @@
 """Main orchestration for selecting papers."""
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
-import random
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
 
 from mldigest.models import Paper
-from mldigest.selector.quality import select_quality
-from mldigest.selector.trending import select_trending
-from mldigest.signals.hf_signal import apply_hf_signal
-from mldigest.signals.keywords import assign_topics
-from mldigest.signals.recency import recency_score
-from mldigest.utils import dedupe_arxiv_id, fuzzy_title_match, normalize_title
+from mldigest.selector.constrained import DiversityHeap, ScoreHeap, SlotFiller, SourceChain, fill_slots, slot_roles
+from mldigest.selector.exploration import exploration_base, exploration_features
+from mldigest.selector.quality import score_quality
+from mldigest.selector.trending import score_trending, score_trending_fallback
+from mldigest.signals.authors import followed_author_keys, followed_bonus
+from mldigest.signals.minhash import near_duplicate_pairs
+from mldigest.signals.parallel import compute_signals
+from mldigest.signals.recency import paper_recency
+from mldigest.signals.tfidf import tfidf_matrix
+from mldigest.utils import dedupe_arxiv_id, fuzzy_title_match, get_logger, normalize_title
+
+logger = get_logger(__name__)
+
+# Lookup that updates papers in place: screeners are cheap bulk lookups run over every
+# candidate before screening, enrichers costly per-paper ones run on the shortlist only.
+Enricher = Callable[[List[Paper]], object]
 
 
 def _merge_by_key(existing: dict[str, Paper], key: str, paper: Paper) -> None:
@@ -34,132 +47,351 @@ def merge_papers(arxiv_papers: List[Paper], openreview_papers: List[Paper]) -> L
                 break
         if not matched:
             _merge_by_key(merged, normalize_title(paper.title), paper)
-    return list(merged.values())
+    return _merge_near_duplicates(list(merged.values()))
+
 
+def _merge_near_duplicates(papers: List[Paper]) -> List[Paper]:
+    """Fold papers whose abstracts are near-duplicates (reworded titles) into one.
 
-def _fallback_trending(papers: List[Paper], window_days: int, buckets: dict) -> Paper | None:
-    scored = []
-    for paper in papers:
-        assign_topics(paper, buckets)
-        topic_bonus = 1 if paper.topics else 0
-        score = recency_score(paper.published_at, window_days) + topic_bonus
-        paper.scores["trending_fallback"] = score
-        scored.append(paper)
-    ranked = sorted(scored, key=lambda p: p.scores.get("trending_fallback", 0), reverse=True)
-    return ranked[0] if ranked else None
+    MinHash LSH proposes candidate pairs and only those are confirmed by exact
+    shingle Jaccard. Each cluster keeps its earliest member (arXiv before
+    OpenReview), which absorbs the others' sources and signals and records
+    their ids in ``signals["near_duplicates"]``; the folded copies never
+    reach selection.
+    """
+    started = time.perf_counter()
+    pairs, stats = near_duplicate_pairs([paper.abstract for paper in papers])
+    parent = list(range(len(papers)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for left, right, _ in pairs:
+        root_left, root_right = find(left), find(right)
+        if root_left != root_right:
+            parent[max(root_left, root_right)] = min(root_left, root_right)
+    clusters: dict[int, list[int]] = {}
+    for index in range(len(papers)):
+        clusters.setdefault(find(index), []).append(index)
+
+    kept = []
+    for root, members in clusters.items():
+        keeper = papers[root]
+        if len(members) > 1:
+            keeper.signals["near_duplicates"] = [papers[index].paper_id for index in members[1:]]
+            for index in members[1:]:
+                keeper.merge_sources(papers[index])
+        kept.append(keeper)
+    logger.info(
+        "Near-duplicate abstracts: %d documents, %d LSH candidates, %d confirmed, %d papers folded in %.2fs",
+        stats["documents"],
+        stats["candidates"],
+        stats["confirmed"],
+        len(papers) - len(kept),
+        time.perf_counter() - started,
+    )
+    return kept
 
 
 def _selection_reason_recency(paper: Paper, window_days: int) -> str | None:
     if not paper.published_at:
         return None
-    days = int(window_days * (1 - recency_score(paper.published_at, window_days)))
+    days = int(window_days * (1 - paper_recency(paper, window_days)))
     return f"近期發佈: {days} 天內"
 
 
-def orchestrate_selection(
-    arxiv_papers: List[Paper],
-    openreview_papers: List[Paper],
+def score_candidates(merged_candidates: List[Paper], hf_hits: Dict[str, dict], config: dict) -> dict:
+    followed = (config["selection_strategy"].get("followed_authors") or {}).get("names") or []
+    return compute_signals(
+        merged_candidates,
+        hf_hits,
+        config["topics"]["buckets"],
+        config["schedule"]["window_days"],
+        workers=int(config["limits"].get("signal_workers", 1)),
+        followed_authors=followed_author_keys(followed),
+    )
+
+
+def role_pools(merged_candidates: List[Paper], hf_hits: Dict[str, dict]) -> Dict[str, List[Paper]]:
+    """Candidates eligible for each role's primary source.
+
+    Every pool is drawn from the merged candidates, so papers that absorbed an
+    OpenReview submission compete for quality with their topics and signals.
+    """
+    return {
+        "trending": [
+            paper
+            for paper in merged_candidates
+            if paper.paper_id in hf_hits or normalize_title(paper.title) in hf_hits
+        ],
+        "quality": [paper for paper in merged_candidates if paper.signals.get("openreview")],
+        "exploration": [paper for paper in merged_candidates if not paper.signals.get("hf")],
+    }
+
+
+def screen_candidates(
+    merged_candidates: List[Paper],
     hf_hits: Dict[str, dict],
     config: dict,
-) -> Tuple[List[Paper], dict]:
-    merged_candidates = merge_papers(arxiv_papers, openreview_papers)
-    buckets = config["topics"]["buckets"]
+    relevance: Dict[str, float] | None = None,
+) -> Dict[str, List[Paper]]:
+    """Rank every candidate per role on metadata already in hand and keep the top ``limits.shortlist_size``.
+
+    The ranking uses the real role scores on whatever the screeners have
+    resolved (e.g. prefetched OpenReview decisions and ratings); papers still
+    missing evidence rank as if it were absent, so one left off the shortlist
+    could in principle have won with it. A size of 0 keeps everything, i.e.
+    full enrichment.
+    """
+    size = int(config["limits"].get("shortlist_size", 20))
+    size = max(size, int(config["limits"]["papers_per_cycle"])) if size else None
+    window_days = config["schedule"]["window_days"]
+    strategy = config["selection_strategy"]
+    pools = role_pools(merged_candidates, hf_hits)
+
+    trending = sorted(
+        pools["trending"],
+        key=lambda paper: score_trending(paper, window_days, strategy["trending"]["weights"])
+        + followed_bonus(paper, strategy),
+        reverse=True,
+    )
+    quality = sorted(
+        pools["quality"],
+        key=lambda paper: score_quality(paper, window_days, strategy["quality"]["venue_bonus"])
+        + followed_bonus(paper, strategy),
+        reverse=True,
+    )
+    exploration_pool = pools["exploration"]
+    exploration = []
+    if exploration_pool:
+        base = exploration_base(
+            exploration_features(exploration_pool, window_days, config["topics"]["buckets"], relevance),
+            strategy["exploration"]["weights"],
+        ) + np.array([followed_bonus(paper, strategy) for paper in exploration_pool])
+        exploration = [exploration_pool[index] for index in np.argsort(-base, kind="stable")[:size]]
+    return {"trending": trending[:size], "quality": quality[:size], "exploration": exploration}
+
+
+def _run_enrichers(papers: List[Paper], enrichers: Sequence[Enricher], seconds: dict) -> None:
+    for enricher in enrichers:
+        name = getattr(enricher, "func", enricher).__name__
+        started = time.perf_counter()
+        enricher(papers)
+        seconds[name] = round(time.perf_counter() - started, 4)
+
+
+def enrich_shortlist(shortlist: Dict[str, List[Paper]], enrichers: Sequence[Enricher]) -> dict:
+    papers = list({id(paper): paper for role in shortlist.values() for paper in role}.values())
+    stats: dict = {"shortlisted": len(papers), "seconds": {}}
+    _run_enrichers(papers, enrichers, stats["seconds"])
+    return stats
+
+
+def enrich_candidates(
+    merged_candidates: List[Paper],
+    hf_hits: Dict[str, dict],
+    config: dict,
+    relevance: Dict[str, float] | None = None,
+    screeners: Sequence[Enricher] = (),
+    enrichers: Sequence[Enricher] = (),
+) -> dict:
+    """Two-phase enrichment ahead of :func:`select_papers`; updates the papers in place.
+
+    ``screeners`` run over every candidate, rejected papers are dropped, the
+    rest are screened per role and ``enrichers`` run on the shortlist only.
+    Returns the timings and shortlist size for ``scoring_debug``.
+    """
+    seconds: dict = {}
+    _run_enrichers(merged_candidates, screeners, seconds)
+    stats: dict = {"shortlisted": 0, "seconds": seconds}
+    if enrichers:
+        shortlist = screen_candidates(
+            [paper for paper in merged_candidates if not is_rejected(paper)], hf_hits, config, relevance
+        )
+        shortlisted = enrich_shortlist(shortlist, enrichers)
+        stats["shortlisted"] = shortlisted["shortlisted"]
+        seconds.update(shortlisted["seconds"])
+    stats["rejected"] = sum(1 for paper in merged_candidates if is_rejected(paper))
+    return stats
+
+
+def is_rejected(paper: Paper) -> bool:
+    return bool((paper.signals.get("openreview") or {}).get("rejected"))
+
+
+def source_chains(
+    merged_candidates: List[Paper],
+    hf_hits: Dict[str, dict],
+    config: dict,
+    filler: SlotFiller,
+    vectors: sparse.csr_matrix,
+    relevance: Dict[str, float] | None = None,
+) -> Dict[str, SourceChain]:
+    """Per-role heap factories for :func:`fill_slots`, scored exactly as the selection scores them.
+
+    Exploration's heap is a :class:`DiversityHeap` built when its first slot
+    comes up, so its diversity term sees the papers selected by then.
+    ``vectors`` holds one TF-IDF row per merged candidate.
+    """
     window_days = config["schedule"]["window_days"]
+    strategy = config["selection_strategy"]
+    pools = role_pools(merged_candidates, hf_hits)
+
+    def trending() -> ScoreHeap:
+        weights = strategy["trending"]["weights"]
+        return ScoreHeap(
+            (score_trending(paper, window_days, weights) + followed_bonus(paper, strategy), paper)
+            for paper in pools["trending"]
+        )
+
+    def quality() -> ScoreHeap:
+        venue_bonus = strategy["quality"]["venue_bonus"]
+        return ScoreHeap(
+            (score_quality(paper, window_days, venue_bonus) + followed_bonus(paper, strategy), paper)
+            for paper in pools["quality"]
+        )
+
+    def fallback() -> ScoreHeap:
+        return ScoreHeap((score_trending_fallback(paper, window_days), paper) for paper in merged_candidates)
 
-    for paper in merged_candidates:
-        assign_topics(paper, buckets)
-        apply_hf_signal(paper, hf_hits)
+    def recency() -> ScoreHeap:
+        return ScoreHeap((paper_recency(paper, window_days), paper) for paper in merged_candidates)
+
+    def exploration() -> DiversityHeap:
+        rows = [index for index, paper in enumerate(merged_candidates) if not paper.signals.get("hf")]
+        papers = [merged_candidates[index] for index in rows]
+        weights = strategy["exploration"]["weights"]
+        features = exploration_features(papers, window_days, config["topics"]["buckets"], relevance)
+        return DiversityHeap(
+            papers,
+            exploration_base(features, weights) + np.array([followed_bonus(paper, strategy) for paper in papers]),
+            vectors[rows],
+            filler.selected_vectors,
+            weights.get("topic_diversity", 0.1),
+        )
+
+    return {
+        "trending": [("trending", trending), ("fallback", fallback), ("recency", recency)],
+        "quality": [("quality", quality), ("fallback", fallback), ("recency", recency)],
+        "exploration": [("exploration", exploration), ("recency", recency)],
+    }
+
+
+def select_papers(
+    merged_candidates: List[Paper],
+    hf_hits: Dict[str, dict],
+    config: dict,
+    relevance: Dict[str, float] | None = None,
+    signal_stats: dict | None = None,
+    enrichment: dict | None = None,
+) -> Tuple[List[Paper], dict]:
+    """Fill ``limits.papers_per_cycle`` slots cycling trending, quality and exploration.
 
-    trending_weights = config["selection_strategy"]["trending"]["weights"]
-    trending, trending_debug = select_trending(merged_candidates, hf_hits, window_days, trending_weights)
-    if not trending:
-        trending = _fallback_trending(merged_candidates, window_days, buckets)
+    No topic may appear on more than ``limits.per_topic_cap`` selected papers;
+    see :mod:`mldigest.selector.constrained` for the heap-based fill. Papers
+    the ``followed_authors`` signal matched (see :func:`score_candidates`)
+    get ``selection_strategy.followed_authors.boost`` added to their
+    trending, quality and exploration scores. Run :func:`enrich_candidates`
+    first to resolve OpenReview decisions; papers it found rejected are
+    never selected, and its stats are passed through as ``enrichment``.
+    """
+    window_days = config["schedule"]["window_days"]
+    followed_matches = sum(1 for paper in merged_candidates if paper.signals.get("followed_authors"))
+    merged_candidates = [paper for paper in merged_candidates if not is_rejected(paper)]
 
-    selected: list[Paper] = []
+    vectors = tfidf_matrix(merged_candidates)
+    filler = SlotFiller(
+        int(config["limits"]["per_topic_cap"]),
+        vectors,
+        {id(paper): row for row, paper in enumerate(merged_candidates)},
+    )
+    chains = source_chains(merged_candidates, hf_hits, config, filler, vectors, relevance)
+    heaps = {name: build() for name, build in (chains["trending"][0], chains["quality"][0])}
     scoring_debug = {
-        "trending": trending_debug,
-        "quality": [],
+        "trending": [(p.paper_id, score, p.signals.get("hf", {})) for score, p in heaps["trending"].top(10)],
+        "quality": [(p.paper_id, score, p.signals.get("openreview", {})) for score, p in heaps["quality"].top(10)],
         "exploration": [],
+        "signals": signal_stats or {},
+        "enrichment": enrichment or {},
+        "followed_authors": followed_matches,
+    }
+
+    def record_exploration() -> DiversityHeap:
+        heap = build_exploration()
+        scoring_debug["exploration"] = [
+            (p.paper_id, score, p.signals.get("engineering", {})) for score, p in heap.top(10)
+        ]
+        return heap
+
+    (_, build_exploration), *exploration_fallbacks = chains["exploration"]
+    chains["exploration"] = [("exploration", record_exploration), *exploration_fallbacks]
+
+    slots = slot_roles(int(config["limits"]["papers_per_cycle"]))
+    for role, paper, source in fill_slots(slots, filler, chains, heaps):
+        _annotate(paper, role, source, window_days)
+
+    per_topic_cap = int(config["limits"]["per_topic_cap"])
+    scoring_debug["slots"] = {
+        "requested": len(slots),
+        "filled": len(filler.selected),
+        "short": len(filler.selected) < len(slots),
+        "per_topic_cap": per_topic_cap,
+        "relaxed_per_topic_cap": filler.per_topic_cap if filler.per_topic_cap != per_topic_cap else None,
+        "skipped": dict(filler.skipped),
     }
+    if filler.per_topic_cap != per_topic_cap:
+        logger.warning(
+            "per_topic_cap %d left slots empty; raised to %d to fill them", per_topic_cap, filler.per_topic_cap
+        )
+    if len(filler.selected) < len(slots):
+        logger.warning(
+            "Selection is short: requested %d papers, filled %d (skipped %s)",
+            len(slots),
+            len(filler.selected),
+            dict(filler.skipped),
+        )
+    return filler.selected, scoring_debug
+
 
-    if trending:
-        hf_signal = trending.signals.get("hf", {})
+def _annotate(paper: Paper, role: str, source: str, window_days: int) -> None:
+    if source == "recency":
+        paper.selection_reasons.append("候選不足，使用 recency fallback")
+        recency_reason = _selection_reason_recency(paper, window_days)
+        if recency_reason:
+            paper.selection_reasons.append(recency_reason)
+        paper.signals["role"] = role
+        return
+
+    if role == "trending":
+        hf_signal = paper.signals.get("hf", {})
         if hf_signal:
-            trending.selection_reasons.append(f"HF 命中: {', '.join(hf_signal.get('query_hits', []))}")
+            paper.selection_reasons.append(f"HF 命中: {', '.join(hf_signal.get('query_hits', []))}")
         else:
-            trending.selection_reasons.append("HF 未命中，使用 arXiv 近期 + 主題 fallback")
-        recency_reason = _selection_reason_recency(trending, window_days)
-        if recency_reason:
-            trending.selection_reasons.append(recency_reason)
-        if trending.topics:
-            trending.selection_reasons.append(f"主題: {'/'.join(trending.topics)}")
-        trending.signals["role"] = "trending"
-        selected.append(trending)
-
-    quality, quality_debug = select_quality(
-        openreview_papers,
-        window_days,
-        config["selection_strategy"]["quality"]["venue_bonus"],
-    )
-    scoring_debug["quality"] = quality_debug
-    if quality and trending and fuzzy_title_match(quality.title, trending.title):
-        quality = None
-    if not quality:
-        fallback_pool = [paper for paper in merged_candidates if paper not in selected]
-        quality = _fallback_trending(fallback_pool, window_days, buckets)
-        if quality:
-            quality.selection_reasons.append("OpenReview 不可用，使用 arXiv 近期 fallback")
-    if quality:
-        openreview_signal = quality.signals.get("openreview", {})
+            paper.selection_reasons.append("HF 未命中，使用 arXiv 近期 + 主題 fallback")
+    elif role == "quality":
+        if source == "fallback":
+            paper.selection_reasons.append("OpenReview 不可用，使用 arXiv 近期 fallback")
+        openreview_signal = paper.signals.get("openreview", {})
         if openreview_signal:
-            quality.selection_reasons.append(
+            paper.selection_reasons.append(
                 f"OpenReview: {openreview_signal.get('venue', '')} {openreview_signal.get('decision', '')}".strip()
             )
         if openreview_signal.get("mean_rating"):
-            quality.selection_reasons.append(f"Mean rating: {openreview_signal.get('mean_rating')}")
-        recency_reason = _selection_reason_recency(quality, window_days)
-        if recency_reason:
-            quality.selection_reasons.append(recency_reason)
-        if quality.topics:
-            quality.selection_reasons.append(f"主題: {'/'.join(quality.topics)}")
-        quality.signals["role"] = "quality"
-        selected.append(quality)
-
-    exploration_candidates = []
-    for paper in merged_candidates:
-        if any(fuzzy_title_match(paper.title, chosen.title) for chosen in selected):
-            continue
-        if paper.signals.get("hf"):
-            continue
-        exploration_candidates.append(paper)
-
-    scoring_debug["exploration"] = []
-    if exploration_candidates:
-        exploration = random.choice(exploration_candidates)
-        exploration.selection_reasons.append("未在 HF 上榜（探索）")
-        exploration.selection_reasons.append("隨機選擇自 arXiv 候選")
-        recency_reason = _selection_reason_recency(exploration, window_days)
-        if recency_reason:
-            exploration.selection_reasons.append(recency_reason)
-        if exploration.topics:
-            exploration.selection_reasons.append(f"主題: {'/'.join(exploration.topics)}")
-        exploration.signals["role"] = "exploration"
-        selected.append(exploration)
-
-    if len(selected) < 3:
-        existing_roles = {paper.signals.get("role") for paper in selected}
-        missing_roles = [role for role in ["trending", "quality", "exploration"] if role not in existing_roles]
-        remaining = [paper for paper in merged_candidates if paper not in selected]
-        remaining.sort(key=lambda p: recency_score(p.published_at, window_days), reverse=True)
-        for role in missing_roles:
-            if not remaining:
-                break
-            paper = remaining.pop(0)
-            paper.selection_reasons.append("候選不足，使用 recency fallback")
-            recency_reason = _selection_reason_recency(paper, window_days)
-            if recency_reason:
-                paper.selection_reasons.append(recency_reason)
-            paper.signals["role"] = role
-            selected.append(paper)
-
-    return selected, scoring_debug
+            paper.selection_reasons.append(f"Mean rating: {openreview_signal.get('mean_rating')}")
+    else:
+        paper.selection_reasons.append("未在 HF 上榜（探索）")
+        paper.selection_reasons.append(
+            f"探索分數 {paper.scores['exploration']:.2f}，"
+            f"與已選 paper 最大相似度 {paper.scores['exploration_similarity']:.2f}"
+        )
+    recency_reason = _selection_reason_recency(paper, window_days)
+    if recency_reason:
+        paper.selection_reasons.append(recency_reason)
+    if paper.signals.get("followed_authors"):
+        paper.selection_reasons.append(f"追蹤作者: {', '.join(paper.signals['followed_authors'])}")
+    if paper.topics:
+        paper.selection_reasons.append(f"主題: {'/'.join(paper.topics)}")
+    paper.signals["role"] = role
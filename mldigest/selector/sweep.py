@@ -0,0 +1,371 @@
+"""Evaluate many selection weight settings against one frozen, enriched candidate pool.
+
+Every score the selectors compute is linear in its weights, so the
+weight-independent features are built once and the trending, quality and
+exploration base scores of a whole chunk of settings come out of one matrix
+product each. Each setting then runs the selector's own slot fill
+(:func:`mldigest.selector.constrained.fill_slots`) over its rows of those
+matrices for all ``limits.papers_per_cycle`` slots: fallback chains,
+``per_topic_cap`` (and its relaxation), duplicate checks and the
+followed-authors boost behave as in a real run. A slot whose best candidate
+is admissible costs one ``argmax``, and the exploration diversity term is
+rescored from similarities cached per selection prefix, which settings share.
+"""
+from __future__ import annotations
+
+import itertools
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mldigest.models import Paper
+from mldigest.selector.constrained import (
+    RankedScores,
+    SlotFiller,
+    SourceChain,
+    fill_slots,
+    primary_topic,
+    slot_roles,
+)
+from mldigest.selector.exploration import EXPLORATION_TERMS, exploration_features
+from mldigest.selector.orchestrator import is_rejected, role_pools
+from mldigest.selector.trending import score_trending_fallback
+from mldigest.signals.authors import followed_bonus
+from mldigest.signals.recency import paper_recency
+from mldigest.signals.tfidf import tfidf_matrix
+
+PARAMETER_PREFIXES = ("trending.weights.", "quality.venue_bonus.", "exploration.weights.")
+TRENDING_TERMS: Dict[str, float] = {"hf_rank": 0.6, "recency": 0.4}
+# Settings scored per matrix product; bounds the score matrices to a few MB on large pools.
+_CHUNK = 256
+
+
+def parse_parameter(spec: str) -> Tuple[str, List[float]]:
+    """``path=v1,v2,...`` or ``path=start:stop:steps`` (inclusive linspace)."""
+    path, _, values = spec.partition("=")
+    path = path.strip()
+    if not path.startswith(PARAMETER_PREFIXES) or not values:
+        raise ValueError(f"Unsupported sweep parameter: {spec!r} (expected one of {', '.join(PARAMETER_PREFIXES)})")
+    if values.count(":") == 2:
+        start, stop, steps = values.split(":")
+        return path, [float(value) for value in np.linspace(float(start), float(stop), int(steps))]
+    return path, [float(value) for value in values.split(",")]
+
+
+def build_settings(
+    parameters: Dict[str, List[float]],
+    samples: Optional[int] = None,
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """Full grid over ``parameters``, or ``samples`` uniform draws within each parameter's range."""
+    names = list(parameters)
+    if samples is None:
+        return [dict(zip(names, values)) for values in itertools.product(*parameters.values())]
+    rng = np.random.default_rng(seed)
+    lows = np.array([min(values) for values in parameters.values()])
+    highs = np.array([max(values) for values in parameters.values()])
+    draws = rng.uniform(lows, highs, size=(samples, len(names)))
+    return [dict(zip(names, map(float, row))) for row in draws]
+
+
+def _weight_matrix(settings: List[Dict[str, float]], prefix: str, defaults: Dict[str, float]) -> np.ndarray:
+    return np.array(
+        [[setting.get(f"{prefix}{name}", default) for name, default in defaults.items()] for setting in settings],
+        dtype=float,
+    ).reshape(len(settings), len(defaults))
+
+
+class WeightSweep:
+    """Frozen candidate pool plus the weight-independent features of every selector."""
+
+    def __init__(
+        self,
+        candidates: List[Paper],
+        hf_hits: dict,
+        config: dict,
+        relevance: Dict[str, float] | None = None,
+    ):
+        self.config = config
+        self.strategy = config["selection_strategy"]
+        self.window_days = config["schedule"]["window_days"]
+        self.per_topic_cap = int(config["limits"]["per_topic_cap"])
+        self.slots = slot_roles(int(config["limits"]["papers_per_cycle"]))
+        # Same pool as select_papers: papers enrichment found rejected are never picked.
+        candidates = [paper for paper in candidates if not is_rejected(paper)]
+        self.candidates = candidates
+        self.rows = {id(paper): row for row, paper in enumerate(candidates)}
+        topics = [primary_topic(paper) for paper in candidates]
+        self.topic_codes = {topic: code for code, topic in enumerate(dict.fromkeys(topics))}
+        self.primary_topic = np.array([self.topic_codes[topic] for topic in topics], dtype=int)
+        self.vectors = tfidf_matrix(candidates)
+        boost = np.array([followed_bonus(paper, self.strategy) for paper in candidates], dtype=float)
+        pools = role_pools(candidates, hf_hits)
+
+        self.trending = pools["trending"]
+        self.trending_features = np.array(
+            [
+                [paper.signals.get("hf", {}).get("best_rank_proxy", 0) for paper in self.trending],
+                [paper_recency(paper, self.window_days) for paper in self.trending],
+            ],
+            dtype=float,
+        ).reshape(2, len(self.trending))
+        self.trending_rows = [self.rows[id(paper)] for paper in self.trending]
+        self.trending_boost = boost[self.trending_rows]
+
+        self.quality = pools["quality"]
+        venues = [paper.signals["openreview"].get("venue", "") or "" for paper in self.quality]
+        self.venues = sorted(set(venues))
+        self.venue_index = np.array([self.venues.index(venue) for venue in venues], dtype=int)
+        self.quality_base = np.array(
+            [
+                float(paper.signals["openreview"].get("mean_rating") or 0) + paper_recency(paper, self.window_days)
+                for paper in self.quality
+            ]
+        )
+        self.quality_rows = [self.rows[id(paper)] for paper in self.quality]
+        self.quality_base += boost[self.quality_rows]
+
+        self.exploration = pools["exploration"]
+        self.exploration_rows = [self.rows[id(paper)] for paper in self.exploration]
+        features = exploration_features(
+            self.exploration, self.window_days, config["topics"]["buckets"], relevance
+        )
+        self.exploration_features = np.vstack(
+            [features[feature] for feature, _ in EXPLORATION_TERMS.values()]
+        ).reshape(len(EXPLORATION_TERMS), len(self.exploration))
+        self.exploration_boost = boost[self.exploration_rows]
+        self.exploration_vectors = self.vectors[self.exploration_rows]
+        self._similarity: Dict[tuple, np.ndarray] = {}
+
+        # Weight-independent fallbacks: ranked once, replayed by every setting.
+        fallback = np.array([score_trending_fallback(paper, self.window_days) for paper in candidates])
+        recency = np.array([paper_recency(paper, self.window_days) for paper in candidates])
+        self.fallback_order = np.argsort(-fallback, kind="stable")
+        self.recency_order = np.argsort(-recency, kind="stable")
+
+    def _defaults(self, role: str) -> Dict[str, float]:
+        if role == "trending":
+            configured = self.strategy["trending"]["weights"]
+            return {name: configured.get(name, default) for name, default in TRENDING_TERMS.items()}
+        if role == "quality":
+            return dict(self.strategy["quality"]["venue_bonus"])
+        configured = self.strategy["exploration"]["weights"]
+        defaults = {name: configured.get(name, default) for name, (_, default) in EXPLORATION_TERMS.items()}
+        defaults["topic_diversity"] = configured.get("topic_diversity", 0.1)
+        return defaults
+
+    def _venue_bonus(self, settings: List[Dict[str, float]]) -> np.ndarray:
+        """Bonus per (setting, venue): the largest matching venue_bonus value, floored at 0."""
+        defaults = self._defaults("quality")
+        for setting in settings:
+            for path in setting:
+                if path.startswith("quality.venue_bonus."):
+                    defaults.setdefault(path[len("quality.venue_bonus.") :], 0.0)
+        bonus_values = _weight_matrix(settings, "quality.venue_bonus.", defaults)
+        matches = np.array(
+            [[key.lower() in venue.lower() for key in defaults] for venue in self.venues], dtype=bool
+        ).reshape(len(self.venues), len(defaults))
+        return np.where(matches[None, :, :], bonus_values[:, None, :], 0.0).max(axis=2, initial=0.0)
+
+    def _exploration_similarity(self, selected: List[Paper]) -> np.ndarray:
+        """Max cosine similarity of every exploration candidate to ``selected``, cached per selection prefix."""
+        key = tuple(id(paper) for paper in selected)
+        if key not in self._similarity:
+            if not selected or not len(self.exploration):
+                similarity = np.zeros(len(self.exploration))
+            else:
+                newest = self.vectors[self.rows[id(selected[-1])]]
+                similarity = np.maximum(
+                    self._exploration_similarity(selected[:-1]),
+                    (self.exploration_vectors @ newest.T).toarray().ravel(),
+                )
+            self._similarity[key] = similarity
+        return self._similarity[key]
+
+    def _capped(self, filler: SlotFiller) -> np.ndarray:
+        """Candidates whose primary topic is at ``per_topic_cap`` already.
+
+        Topic counts only grow, so dropping these when a heap is built skips
+        what ``SlotFiller`` would reject one by one anyway.
+        """
+        full = np.zeros(len(self.topic_codes), dtype=bool)
+        for topic, count in filler.topic_counts.items():
+            if topic is not None and count >= filler.per_topic_cap:
+                full[self.topic_codes[topic]] = True
+        return full[self.primary_topic]
+
+    def _chains(
+        self,
+        filler: SlotFiller,
+        trending_scores: np.ndarray,
+        quality_scores: np.ndarray,
+        exploration_base: np.ndarray,
+        diversity_weight: float,
+    ) -> Dict[str, SourceChain]:
+        """The selector's source chains for one setting, over its precomputed score vectors."""
+
+        def ranked(papers: List[Paper], rows: List[int], scores: Callable[[], np.ndarray]) -> "_CappedScores":
+            return _CappedScores(papers, rows, scores, filler, self._capped)
+
+        def ordered(order: np.ndarray) -> "_CappedOrder":
+            return _CappedOrder(self.candidates, order, filler, self._capped)
+
+        def trending() -> "_CappedScores":
+            return ranked(self.trending, self.trending_rows, lambda: trending_scores)
+
+        def quality() -> "_CappedScores":
+            return ranked(self.quality, self.quality_rows, lambda: quality_scores)
+
+        def exploration() -> "_CappedScores":
+            # The diversity term moves with every pick; similarities are cached per selection prefix.
+            def scores() -> np.ndarray:
+                return exploration_base + diversity_weight * (1.0 - self._exploration_similarity(filler.selected))
+
+            return ranked(self.exploration, self.exploration_rows, scores)
+
+        def fallback() -> "_CappedOrder":
+            return ordered(self.fallback_order)
+
+        def recency() -> "_CappedOrder":
+            return ordered(self.recency_order)
+
+        return {
+            "trending": [("trending", trending), ("fallback", fallback), ("recency", recency)],
+            "quality": [("quality", quality), ("fallback", fallback), ("recency", recency)],
+            "exploration": [("exploration", exploration), ("recency", recency)],
+        }
+
+    def _by_slot(self, filled: List[Tuple[str, Paper, str]]) -> List[Optional[Paper]]:
+        """Picks in slot order; a role's picks fill that role's slots in order, whichever pass filled them."""
+        picks: Dict[str, list] = {role: [] for role in self.slots}
+        for role, paper, _source in filled:
+            picks[role].append(paper)
+        queues = {role: iter(papers) for role, papers in picks.items()}
+        return [next(queues[role], None) for role in self.slots]
+
+    def evaluate(self, settings: List[Dict[str, float]]) -> List[List[Optional[Paper]]]:
+        """The pick of every slot in ``self.slots`` (``None`` if left empty) for every setting."""
+        results: list[List[Optional[Paper]]] = []
+        for start in range(0, len(settings), _CHUNK):
+            chunk = settings[start : start + _CHUNK]
+            trending = (
+                _weight_matrix(chunk, "trending.weights.", self._defaults("trending")) @ self.trending_features
+                + self.trending_boost
+            )
+            quality = self._venue_bonus(chunk)[:, self.venue_index] + self.quality_base
+            exploration_weights = _weight_matrix(chunk, "exploration.weights.", self._defaults("exploration"))
+            exploration = exploration_weights[:, :-1] @ self.exploration_features + self.exploration_boost
+            for index in range(len(chunk)):
+                filler = SlotFiller(self.per_topic_cap, self.vectors, self.rows)
+                chains = self._chains(
+                    filler, trending[index], quality[index], exploration[index], exploration_weights[index, -1]
+                )
+                results.append(self._by_slot(fill_slots(self.slots, filler, chains)))
+        return results
+
+
+class _CappedScores:
+    """Pops ``papers`` by descending ``scores()`` (first index on ties, like a stable sort).
+
+    Whenever the selection has grown, the scores are re-read (exploration's
+    diversity term depends on the selection) and capped topics are dropped in
+    bulk, so a slot usually costs one ``argmax``. Exact greedy rather than
+    :class:`DiversityHeap`'s lazy rescoring, which picks the same paper.
+    """
+
+    def __init__(
+        self,
+        papers: List[Paper],
+        rows: List[int],
+        scores: Callable[[], np.ndarray],
+        filler: SlotFiller,
+        capped: Callable[[SlotFiller], np.ndarray],
+    ):
+        self.papers = papers
+        self.rows = rows
+        self.rescore = scores
+        self.filler = filler
+        self.capped = capped
+        self.dropped = np.zeros(len(papers), dtype=bool)
+        self.scores = np.zeros(0)
+        self.seen = -1
+
+    def pop(self, capped: Callable[[Paper], bool]) -> Optional[Paper]:
+        if self.seen != len(self.filler.selected):
+            self.seen = len(self.filler.selected)
+            self.dropped |= self.capped(self.filler)[self.rows]
+            self.scores = np.where(self.dropped, -np.inf, self.rescore())
+        while len(self.scores):
+            index = int(np.argmax(self.scores))
+            if self.scores[index] == -np.inf:
+                return None
+            self.scores[index] = -np.inf
+            self.dropped[index] = True
+            if not capped(self.papers[index]):
+                return self.papers[index]
+        return None
+
+
+class _CappedOrder:
+    """A fixed candidate order shared across slots; capped topics are dropped in bulk as the selection grows."""
+
+    def __init__(
+        self,
+        papers: List[Paper],
+        order: np.ndarray,
+        filler: SlotFiller,
+        capped: Callable[[SlotFiller], np.ndarray],
+    ):
+        self.papers = papers
+        self.order = order
+        self.filler = filler
+        self.capped = capped
+        self.seen = -1
+
+    def pop(self, capped: Callable[[Paper], bool]) -> Optional[Paper]:
+        if self.seen != len(self.filler.selected):
+            self.seen = len(self.filler.selected)
+            self.order = self.order[~self.capped(self.filler)[self.order]]
+        heap = RankedScores(self.papers, None, order=self.order)
+        paper = heap.pop(capped)
+        self.order = self.order[heap.popped :]
+        return paper
+
+
+def summarize(
+    results: List[List[Optional[Paper]]],
+    reference: List[Optional[Paper]],
+    slots: List[str],
+) -> dict:
+    """Pick frequencies per slot and how often settings agree with ``reference``."""
+
+    def key(paper: Optional[Paper]) -> Optional[str]:
+        return paper.paper_id if paper is not None else None
+
+    total = len(results)
+    titles = {key(paper): paper.title for result in results for paper in result if paper is not None}
+    summary: dict = {"settings": total, "slots": []}
+    for slot, role in enumerate(slots):
+        counts = Counter(key(result[slot]) for result in results)
+        summary["slots"].append(
+            {
+                "slot": slot + 1,
+                "role": role,
+                "distinct": len(counts),
+                "agreement_with_config": round(
+                    sum(1 for result in results if key(result[slot]) == key(reference[slot])) / total, 4
+                )
+                if total
+                else None,
+                "picks": [
+                    {"paper_id": paper_id, "title": titles.get(paper_id, ""), "share": round(count / total, 4)}
+                    for paper_id, count in counts.most_common()
+                ],
+            }
+        )
+    combos = Counter(tuple(map(key, result)) for result in results)
+    summary["distinct_selections"] = len(combos)
+    summary["modal_selection_share"] = round(combos.most_common(1)[0][1] / total, 4) if total else None
+    summary["unchanged_share"] = round(combos.get(tuple(map(key, reference)), 0) / total, 4) if total else None
+    return summary
@@ -0,0 +1,105 @@
+"""Canonical author keys and the followed-authors signal."""
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from mldigest.models import Paper
+from mldigest.signals.registry import SignalContext, register
+
+_NAME_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv"})
+
+
+@lru_cache(maxsize=65536)
+def author_key(name: str) -> str:
+    """``"<surname> <first given name>"``, so "Yann LeCun" and "LeCun, Yann" agree.
+
+    Accents, punctuation and generational suffixes are dropped and "Last,
+    First" is reordered first. The given name stays whole, so "Wei Zhang"
+    and "Wenjie Zhang" differ; it is an initial only when the source gave
+    one ("Y. LeCun" -> ``"lecun y"``, see :func:`initial_key`). Digits are
+    kept and a number is attached to the name before it, so "Author 1" and
+    "Author 2" (or OpenReview's "Wei Zhang2") stay apart.
+    """
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    if "," in text:
+        last, _, first = text.partition(",")
+        text = f"{first} {last}"
+    tokens: List[str] = []
+    for token in _NAME_TOKEN_RE.findall(text):
+        if token in _SUFFIXES:
+            continue
+        if token.isdigit() and tokens:
+            tokens[-1] += token
+        else:
+            tokens.append(token)
+    if not tokens:
+        return ""
+    if len(tokens) == 1:
+        return tokens[0]
+    return f"{tokens[-1]} {tokens[0]}"
+
+
+def initial_key(key: str) -> Tuple[str, bool]:
+    """``author_key`` reduced to surname + first initial, and whether ``key`` was only that to begin with."""
+    surname, _, given = key.partition(" ")
+    if not given:
+        return key, False
+    return f"{surname} {given[0]}", len(given) == 1
+
+
+def followed_author_keys(names: Iterable[str]) -> Dict[str, str]:
+    """Canonical key -> configured name for ``selection_strategy.followed_authors.names``."""
+    return {key: name for name in names if (key := author_key(name))}
+
+
+def _followed_names(
+    key: str, followed: Dict[str, str], by_initial: Dict[str, List[Tuple[bool, str]]]
+) -> List[str]:
+    if key in followed:
+        return [followed[key]]
+    short, is_initial = initial_key(key)
+    return [name for followed_is_initial, name in by_initial.get(short, ()) if is_initial or followed_is_initial]
+
+
+def apply_followed_authors(papers: Iterable, followed: Dict[str, str]) -> int:
+    """Set ``signals["followed_authors"]`` to the followed names on each paper; returns papers matched.
+
+    Keys match exactly, or by surname and first initial when either side
+    only gave an initial ("Y. LeCun" follows "Yann LeCun" and vice versa).
+    """
+    by_initial: Dict[str, List[Tuple[bool, str]]] = {}
+    for key, name in followed.items():
+        short, is_initial = initial_key(key)
+        by_initial.setdefault(short, []).append((is_initial, name))
+    matched = 0
+    for paper in papers:
+        hits: List[str] = list(
+            dict.fromkeys(
+                name
+                for key in map(author_key, paper.authors)
+                if key
+                for name in _followed_names(key, followed, by_initial)
+            )
+        )
+        if hits:
+            paper.signals["followed_authors"] = hits
+            matched += 1
+        else:
+            paper.signals.pop("followed_authors", None)
+    return matched
+
+
+@register("followed_authors")
+def followed_authors_signal(papers: List[Paper], context: SignalContext) -> None:
+    apply_followed_authors(papers, context.followed_authors)
+
+
+def followed_bonus(paper, strategy: dict) -> float:
+    """``selection_strategy.followed_authors.boost`` for papers the ``followed_authors`` signal matched."""
+    if not paper.signals.get("followed_authors"):
+        return 0.0
+    return float((strategy.get("followed_authors") or {}).get("boost", 0.5))
@@ -1,7 +1,10 @@
 """Engineering-related signals."""
 from __future__ import annotations
 
+from typing import Iterable, List
+
 from mldigest.models import Paper
+from mldigest.signals.registry import SignalContext, register
 
 
 KEYWORDS = {
@@ -12,16 +15,21 @@ KEYWORDS = {
 }
 
 
-def apply_engineering_signals(paper: Paper) -> None:
-    text = f"{paper.title} {paper.abstract or ''}".lower()
-    has_code_link = False
-    for url in paper.links.values():
-        if "github.com" in url:
-            has_code_link = True
-            break
-    if not has_code_link and "github.com" in text:
-        has_code_link = True
-    signals = paper.signals.setdefault("engineering", {})
-    signals["has_code_link"] = has_code_link
+def engineering_signals(title: str, abstract: str | None, urls: Iterable[str]) -> dict:
+    text = f"{title} {abstract or ''}".lower()
+    has_code_link = any("github.com" in url for url in urls) or "github.com" in text
+    signals = {"has_code_link": has_code_link}
     for name, keywords in KEYWORDS.items():
         signals[f"mentions_{name}"] = any(keyword in text for keyword in keywords)
+    return signals
+
+
+def apply_engineering_signals(paper: Paper) -> None:
+    signals = paper.signals.setdefault("engineering", {})
+    signals.update(engineering_signals(paper.title, paper.abstract, paper.links.values()))
+
+
+@register("engineering")
+def engineering_signal(papers: List[Paper], context: SignalContext) -> None:
+    for paper in papers:
+        apply_engineering_signals(paper)
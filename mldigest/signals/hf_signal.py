@@ -1,13 +1,26 @@
 """Apply Hugging Face signals."""
 from __future__ import annotations
 
+from typing import List
+
 from mldigest.models import Paper
+from mldigest.signals.registry import SignalContext, register
 from mldigest.utils import normalize_title
 
 
+def lookup_hf_hit(paper_id: str, title: str, hf_hits: dict[str, dict]) -> dict | None:
+    return hf_hits.get(paper_id) or hf_hits.get(normalize_title(title))
+
+
 def apply_hf_signal(paper: Paper, hf_hits: dict[str, dict]) -> None:
-    key = paper.paper_id
-    alt_key = normalize_title(paper.title)
-    hit = hf_hits.get(key) or hf_hits.get(alt_key)
+    hit = lookup_hf_hit(paper.paper_id, paper.title, hf_hits)
     if hit:
         paper.signals.setdefault("hf", {}).update(hit)
+
+
+@register("hf")
+def hf_hits_signal(papers: List[Paper], context: SignalContext) -> None:
+    if not context.hf_hits:
+        return
+    for paper in papers:
+        apply_hf_signal(paper, context.hf_hits)
@@ -4,16 +4,22 @@ from __future__ import annotations
 from typing import Dict, List
 
 from mldigest.models import Paper
+from mldigest.signals.registry import SignalContext, register
 
 
-def assign_topics(paper: Paper, buckets: Dict[str, List[str]]) -> List[str]:
-    text = f"{paper.title} {paper.abstract or ''}".lower()
+def match_topics(text: str, buckets: Dict[str, List[str]]) -> List[str]:
+    text = text.lower()
     topics: list[str] = []
     for topic, keywords in buckets.items():
         for keyword in keywords:
             if keyword.lower() in text:
                 topics.append(topic)
                 break
+    return topics
+
+
+def assign_topics(paper: Paper, buckets: Dict[str, List[str]]) -> List[str]:
+    topics = match_topics(f"{paper.title} {paper.abstract or ''}", buckets)
     paper.topics = topics
     return topics
 
@@ -22,3 +28,21 @@ def novelty_keyword_hit(paper: Paper, buckets: Dict[str, List[str]]) -> int:
     if not paper.topics:
         assign_topics(paper, buckets)
     return 1 if paper.topics else 0
+
+
+def paper_novelty(paper: Paper, buckets: Dict[str, List[str]]) -> float:
+    """Novelty frozen by the ``novelty`` signal, or computed now for unscored papers."""
+    novelty = paper.scores.get("novelty")
+    return novelty if novelty is not None else float(novelty_keyword_hit(paper, buckets))
+
+
+@register("topics")
+def topics_signal(papers: List[Paper], context: SignalContext) -> None:
+    for paper in papers:
+        assign_topics(paper, context.buckets)
+
+
+@register("novelty", depends=("topics",))
+def novelty_signal(papers: List[Paper], context: SignalContext) -> None:
+    for paper in papers:
+        paper.scores["novelty"] = 1.0 if paper.topics else 0.0
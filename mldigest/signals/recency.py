@@ -1,11 +1,32 @@
 """Recency signal."""
 from __future__ import annotations
 
+from datetime import datetime
+from typing import List
+
+from mldigest.models import Paper
+from mldigest.signals.registry import SignalContext, register
 from mldigest.utils import days_since
 
 
-def recency_score(published_at: str | None, window_days: int) -> float:
-    days = days_since(published_at)
+def recency_score(published_at: str | None, window_days: int, now: datetime | None = None) -> float:
+    days = days_since(published_at, now=now)
     if days is None:
         return 0.0
     return max(0.0, (window_days - days) / window_days)
+
+
+def paper_recency(paper: Paper, window_days: int) -> float:
+    """Recency frozen at signal-scoring time, or computed now for unscored papers."""
+    recency = paper.scores.get("recency")
+    return recency if recency is not None else recency_score(paper.published_at, window_days)
+
+
+@register("recency")
+def recency_signal(papers: List[Paper], context: SignalContext) -> None:
+    # Papers from the same listing share timestamps; parse each one once.
+    cache: dict[str | None, float] = {}
+    for paper in papers:
+        if paper.published_at not in cache:
+            cache[paper.published_at] = recency_score(paper.published_at, context.window_days, now=context.now)
+        paper.scores["recency"] = cache[paper.published_at]
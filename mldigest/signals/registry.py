@@ -0,0 +1,118 @@
+"""Registry of batch signals computed once per run in dependency order.
+
+A signal is a function over the whole candidate batch that writes its result
+onto the papers (``topics``, ``signals[...]`` or ``scores[...]``). Signals
+declare the signals they read so :func:`run_signals` can order them; each
+runs exactly once and is timed. The order follows from ``depends`` alone
+(ties by name), not from the order modules happened to be imported in.
+Batch functions are free to vectorize or cache across papers.
+"""
+from __future__ import annotations
+
+import heapq
+import importlib
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from mldigest.models import Paper
+
+
+@dataclass(frozen=True)
+class SignalContext:
+    """Run-wide inputs shared by every signal."""
+
+    hf_hits: Dict[str, dict]
+    buckets: dict
+    window_days: int
+    now: datetime
+    # Canonical author key -> configured name (see ``authors.followed_author_keys``).
+    followed_authors: Dict[str, str] = field(default_factory=dict)
+
+
+BatchSignal = Callable[[List[Paper], SignalContext], None]
+
+
+@dataclass(frozen=True)
+class SignalSpec:
+    name: str
+    compute: BatchSignal
+    depends: Tuple[str, ...] = ()
+
+
+REGISTRY: Dict[str, SignalSpec] = {}
+
+# Modules whose import registers the built-in signals.
+BUILTIN_MODULES = (
+    "mldigest.signals.authors",
+    "mldigest.signals.keywords",
+    "mldigest.signals.engineering",
+    "mldigest.signals.hf_signal",
+    "mldigest.signals.recency",
+)
+
+
+def register(name: str, depends: Sequence[str] = ()) -> Callable[[BatchSignal], BatchSignal]:
+    """Decorator adding a batch signal to :data:`REGISTRY` under ``name``."""
+
+    def decorator(compute: BatchSignal) -> BatchSignal:
+        if name in REGISTRY:
+            raise ValueError(f"Signal already registered: {name}")
+        REGISTRY[name] = SignalSpec(name, compute, tuple(depends))
+        return compute
+
+    return decorator
+
+
+def resolve_order(names: Optional[Iterable[str]] = None) -> List[str]:
+    """``names`` (default: every registered signal) plus their dependencies, dependencies first.
+
+    Among signals whose dependencies are all placed, the alphabetically first
+    goes next, so the order is the same whatever the registration order.
+    """
+    for module in BUILTIN_MODULES:
+        importlib.import_module(module)
+    state: dict[str, str] = {}
+
+    def visit(name: str, path: Tuple[str, ...]) -> None:
+        if name not in REGISTRY:
+            raise ValueError(f"Unknown signal {name!r} (required by {' -> '.join(path) or 'caller'})")
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "active":
+            raise ValueError(f"Signal dependency cycle: {' -> '.join(path + (name,))}")
+        state[name] = "active"
+        for dependency in REGISTRY[name].depends:
+            visit(dependency, path + (name,))
+        state[name] = "done"
+
+    for name in sorted(REGISTRY) if names is None else names:
+        visit(name, ())
+    waiting = {name: set(REGISTRY[name].depends) for name in state}
+    ready = [name for name, depends in waiting.items() if not depends]
+    heapq.heapify(ready)
+    order: list[str] = []
+    while ready:
+        name = heapq.heappop(ready)
+        order.append(name)
+        for other, depends in waiting.items():
+            if name in depends:
+                depends.discard(name)
+                if not depends:
+                    heapq.heappush(ready, other)
+    return order
+
+
+def run_signals(
+    papers: List[Paper],
+    context: SignalContext,
+    names: Optional[Iterable[str]] = None,
+) -> Dict[str, float]:
+    """Compute the signals on ``papers`` in dependency order; returns seconds per signal."""
+    timings: dict[str, float] = {}
+    for name in resolve_order(names):
+        started = time.perf_counter()
+        REGISTRY[name].compute(papers, context)
+        timings[name] = round(time.perf_counter() - started, 4)
+    return timings
@@ -0,0 +1,110 @@
+"""Sparse TF-IDF vectors for candidate similarity."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from mldigest.models import Paper
+from mldigest.utils import STOPWORDS
+
+# Bytes that belong to a token (``TOKEN_RE``'s [a-z0-9]); every other byte becomes 0.
+_TOKEN_BYTES = bytes(byte if 48 <= byte <= 57 or 97 <= byte <= 122 else 0 for byte in range(256))
+# _LOW_BYTES[n] keeps the first n bytes of a little-endian 8-byte word.
+_LOW_BYTES = np.array([(1 << (8 * n)) - 1 for n in range(8)] + [2**64 - 1], dtype=np.uint64)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _fmix64(values: np.ndarray) -> np.ndarray:
+    """MurmurHash3's 64-bit finalizer; a bijection, so distinct inputs keep distinct hashes."""
+    values = values ^ (values >> np.uint64(33))
+    values *= np.uint64(0xFF51AFD7ED558CCD)
+    values ^= values >> np.uint64(33)
+    values *= np.uint64(0xC4CEB9FE1A85EC53)
+    values ^= values >> np.uint64(33)
+    return values
+
+
+def _token_hashes(blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Start offset and 64-bit hash of every token in ``blob``.
+
+    ``blob`` is translated with ``_TOKEN_BYTES``, starts with a 0 and ends
+    with eight. Tokens are read eight bytes at a time straight from the
+    buffer, so tokens of up to eight bytes (most words) never collide.
+    """
+    buffer = np.frombuffer(blob, dtype=np.uint8)
+    in_token = buffer != 0
+    edges = np.flatnonzero(in_token[1:] != in_token[:-1]) + 1
+    starts, lengths = edges[0::2], edges[1::2] - edges[0::2]
+    words = np.ndarray(shape=(len(buffer) - 7,), dtype="<u8", buffer=blob, strides=(1,))
+    hashes = words[starts] & _LOW_BYTES[np.minimum(lengths, 8)]
+    longer = np.flatnonzero(lengths > 8)
+    offset = 8
+    while len(longer):
+        chunk = words[starts[longer] + offset] & _LOW_BYTES[np.minimum(lengths[longer] - offset, 8)]
+        hashes[longer] = _fmix64(hashes[longer] * _GOLDEN ^ chunk)
+        longer = longer[lengths[longer] > offset + 8]
+        offset += 8
+    return starts, _fmix64(hashes)
+
+
+@lru_cache(maxsize=1)
+def _ignored_hashes() -> np.ndarray:
+    """Hashes of the stopwords and of one-character tokens (``TOKEN_RE`` needs two)."""
+    words = sorted(STOPWORDS) + [chr(byte) for byte in range(256) if _TOKEN_BYTES[byte]]
+    blob = (b"\0" + b"\0".join(word.encode("ascii") for word in words) + b"\0" * 8).translate(_TOKEN_BYTES)
+    return _token_hashes(blob)[1]
+
+
+def tfidf_matrix(papers: List[Paper]) -> sparse.csr_matrix:
+    """Build L2-normalized TF-IDF rows (one per paper) over title and abstract.
+
+    Tokens are the ``TOKEN_RE`` matches of the lower-cased text minus
+    stopwords, but nothing is tokenized per paper in Python: all texts are
+    joined into one byte buffer, token boundaries and 64-bit token hashes
+    are array operations, and a single sort of packed ``(term hash, paper)``
+    keys yields the per-paper term counts column by column. Columns are
+    terms identified by the top ``64 - log2(len(papers))`` hash bits, so
+    two distinct terms share a column only with negligible probability.
+    """
+    texts = [f"{paper.title} {paper.abstract or ''}".lower().encode("ascii", "replace") for paper in papers]
+    blob = (b"\0" + b"\0".join(texts) + b"\0" * 8).translate(_TOKEN_BYTES)
+    starts, hashes = _token_hashes(blob)
+
+    text_lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    doc_starts = np.cumsum(text_lengths + 1) - text_lengths
+    tokens_per_doc = np.diff(np.append(np.searchsorted(starts, doc_starts), len(starts)))
+    doc_bits = np.uint64(max(len(texts) - 1, 1).bit_length())
+    keys = (hashes >> doc_bits) << doc_bits
+    keys |= np.repeat(np.arange(len(texts), dtype=np.uint64), tokens_per_doc)
+    keys.sort()
+
+    new_pair = np.ones(len(keys), dtype=bool)
+    np.not_equal(keys[1:], keys[:-1], out=new_pair[1:])
+    pair_starts = np.flatnonzero(new_pair)
+    tf = np.diff(np.append(pair_starts, len(keys))).astype(np.float32)
+    pairs = keys[pair_starts]
+    terms = pairs >> doc_bits
+    new_term = np.ones(len(terms), dtype=bool)
+    np.not_equal(terms[1:], terms[:-1], out=new_term[1:])
+    term_starts = np.flatnonzero(new_term)
+    df = np.diff(np.append(term_starts, len(terms)))
+    kept = ~np.isin(terms[term_starts], _ignored_hashes() >> doc_bits)
+    if not kept.any():
+        return sparse.csr_matrix((len(papers), 1), dtype=np.float32)
+    kept_pairs = np.repeat(kept, df)
+    rows = (pairs[kept_pairs] & ((np.uint64(1) << doc_bits) - np.uint64(1))).astype(np.int64)
+    indptr = np.concatenate(([0], np.cumsum(df[kept])))
+    shape = (len(papers), int(kept.sum()))
+    matrix = sparse.csc_matrix((tf[kept_pairs], rows, indptr), shape=shape).tocsr()
+    idf = (np.log((1 + shape[0]) / (1 + df[kept])) + 1.0).astype(np.float32)
+    matrix.data = (1.0 + np.log(matrix.data)) * idf[matrix.indices]
+    row_lengths = np.diff(matrix.indptr)
+    norms = np.sqrt(
+        np.bincount(np.repeat(np.arange(shape[0]), row_lengths), weights=matrix.data**2, minlength=shape[0])
+    )
+    norms[norms == 0] = 1.0
+    matrix.data /= np.repeat(norms, row_lengths).astype(np.float32)
+    return matrix
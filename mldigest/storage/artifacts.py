@@ -9,17 +9,29 @@ from pathlib import Path
 from mldigest.models import Paper
 
 
+def new_artifact_base(runs_dir: str) -> Path:
+    runs_path = Path(runs_dir)
+    runs_path.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    return runs_path / f"digest_{timestamp}"
+
+
+def listing_paths(base: Path) -> dict:
+    return {
+        "html": base.with_name(f"{base.name}_listing.html"),
+        "text": base.with_name(f"{base.name}_listing.txt"),
+    }
+
+
 def write_artifacts(
     runs_dir: str,
     papers: list[Paper],
     html: str,
     text: str,
     payload: dict,
+    base: Path | None = None,
 ) -> dict:
-    runs_path = Path(runs_dir)
-    runs_path.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    base = runs_path / f"digest_{timestamp}"
+    base = base or new_artifact_base(runs_dir)
 
     json_path = base.with_suffix(".json")
     html_path = base.with_suffix(".html")
@@ -0,0 +1,132 @@
+"""Author -> papers index backed by SQLite."""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from mldigest.models import Paper
+from mldigest.signals.authors import author_key, initial_key
+from mldigest.utils import iso_timestamp
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    published_at TEXT
+);
+CREATE TABLE IF NOT EXISTS authorship (
+    author_key TEXT NOT NULL,
+    paper_id TEXT NOT NULL,
+    published_at TEXT,
+    PRIMARY KEY (author_key, paper_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS authorship_recent ON authorship (author_key, published_at);
+CREATE INDEX IF NOT EXISTS authorship_paper ON authorship (paper_id);
+CREATE TABLE IF NOT EXISTS author_names (
+    author_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (author_key, name)
+) WITHOUT ROWID;
+"""
+
+
+def default_author_index_path(cfg: dict) -> Path:
+    storage = cfg["storage"]
+    return Path(storage.get("author_index_path") or Path(storage["runs_dir"]) / "author_index.sqlite3")
+
+
+class AuthorIndex:
+    """Papers keyed by canonical author key (see :func:`mldigest.signals.authors.author_key`).
+
+    Rows are clustered by ``(author_key, published_at)``, so "recent papers by
+    X" is a couple of index range scans, and papers are added or replaced in
+    place. ``published_at`` is stored as ISO text so it sorts and compares
+    the same for every source.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "AuthorIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self.conn.execute("SELECT COUNT(DISTINCT author_key) FROM authorship").fetchone()[0])
+
+    def add_papers(self, papers: Iterable[Paper]) -> int:
+        """Add or replace papers' authorship rows; returns the number of papers written."""
+        written = 0
+        with self.conn:
+            for paper in papers:
+                names = {author_key(name): name for name in paper.authors if name}
+                names.pop("", None)
+                published_at = iso_timestamp(paper.published_at)
+                self.conn.execute("DELETE FROM authorship WHERE paper_id = ?", (paper.paper_id,))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO papers (paper_id, title, published_at) VALUES (?, ?, ?)",
+                    (paper.paper_id, paper.title, published_at),
+                )
+                self.conn.executemany(
+                    "INSERT INTO authorship (author_key, paper_id, published_at) VALUES (?, ?, ?)",
+                    [(key, paper.paper_id, published_at) for key in names],
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO author_names (author_key, name) VALUES (?, ?)", list(names.items())
+                )
+                written += 1
+        return written
+
+    @staticmethod
+    def _key_filter(author: str, column: str = "author_key") -> Tuple[str, list]:
+        """SQL condition on the ``column`` holding author keys for ``author``.
+
+        A full name also matches the bare initial key, which sources that
+        give only initials file papers under; an initial matches every given
+        name.
+        """
+        key = author_key(author)
+        short, is_initial = initial_key(key)
+        if is_initial:
+            # Keys are [a-z0-9 ] only, so this range is exactly the keys starting with ``key``.
+            return f"{column} >= ? AND {column} < ?", [key, f"{key}\x7f"]
+        if short != key:
+            return f"{column} IN (?, ?)", [key, short]
+        return f"{column} = ?", [key]
+
+    def names(self, author: str) -> List[str]:
+        """Spellings seen for ``author``'s canonical key (and its initial, see ``recent_papers``)."""
+        where, params = self._key_filter(author)
+        sql = f"SELECT DISTINCT name FROM author_names WHERE {where} ORDER BY name"
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def recent_papers(
+        self,
+        author: str,
+        since: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        """``(paper_id, title, published_at)`` by ``author``, newest first."""
+        where, params = self._key_filter(author, "a.author_key")
+        if since:
+            where += " AND a.published_at >= ?"
+            params.append(since)
+        params.append(limit)
+        sql = f"""
+            SELECT DISTINCT a.paper_id, p.title, a.published_at
+            FROM authorship a
+            JOIN papers p ON p.paper_id = a.paper_id
+            WHERE {where}
+            ORDER BY a.published_at DESC
+            LIMIT ?
+        """
+        return [(row[0], row[1], row[2]) for row in self.conn.execute(sql, params)]
@@ -0,0 +1,113 @@
+"""Per-stage checkpoints so a failed run can resume without re-fetching."""
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from mldigest.models import Paper
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable hash of JSON-serializable inputs."""
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_candidates(candidates: List[Paper], openreview_papers: List[Paper]) -> dict:
+    """Serialize the candidate pool, keeping OpenReview papers that *are* candidates as references.
+
+    Unmatched OpenReview papers are the same objects in both lists; storing
+    references keeps them single objects after a resume, so the signals
+    computed on the merged pool are the ones found in both lists.
+    """
+    positions = {id(paper): index for index, paper in enumerate(candidates)}
+    openreview = [
+        {"candidate": positions[id(paper)]} if id(paper) in positions else {"paper": paper.to_dict()}
+        for paper in openreview_papers
+    ]
+    return {"candidates": [paper.to_dict() for paper in candidates], "openreview": openreview}
+
+
+def decode_candidates(data: dict) -> Tuple[List[Paper], List[Paper]]:
+    candidates = [Paper.from_dict(item) for item in data["candidates"]]
+    openreview = [
+        candidates[item["candidate"]] if "candidate" in item else Paper.from_dict(item["paper"])
+        for item in data["openreview"]
+    ]
+    return candidates, openreview
+
+
+class StageCheckpoints:
+    """JSON checkpoints under ``<runs_dir>/checkpoints/<run_key>/<stage>.json``.
+
+    Every stage is stored with the fingerprint of its inputs. With ``resume``
+    a stage whose stored fingerprint still matches is loaded instead of run;
+    outputs are always written so a later ``--resume`` can pick them up.
+
+    ``timings`` holds each stage's own wall time: stages computed lazily
+    inside another stage are subtracted from the enclosing one.
+    """
+
+    def __init__(self, runs_dir: str | Path, run_key: str, resume: bool = False):
+        self.directory = Path(runs_dir) / "checkpoints" / run_key
+        self.resume = resume
+        self.timings: dict[str, dict] = {}
+        self._nested: list[float] = []
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def load(self, name: str, key: str) -> Optional[Any]:
+        path = self._path(name)
+        if not path.exists():
+            return None
+        stored = json.loads(path.read_text(encoding="utf-8"))
+        if stored.get("fingerprint") != key:
+            return None
+        return stored["data"]
+
+    def save(self, name: str, key: str, data: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(name)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"fingerprint": key, "data": data}, ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+
+    def stage(
+        self,
+        name: str,
+        key: str,
+        compute: Callable[[], T],
+        encode: Callable[[T], Any] = lambda value: value,
+        decode: Callable[[Any], T] = lambda value: value,
+    ) -> T:
+        started = time.perf_counter()
+        self._nested.append(0.0)
+        resumed = False
+        try:
+            if self.resume:
+                data = self.load(name, key)
+                if data is not None:
+                    logger.info("Stage %s: resumed from checkpoint", name)
+                    resumed = True
+                    return decode(data)
+            result = compute()
+            self.save(name, key, encode(result))
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            inner = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self.timings[name] = {"seconds": round(elapsed - inner, 4), "resumed": resumed}
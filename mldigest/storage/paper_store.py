@@ -0,0 +1,98 @@
+"""Persistent SQLite store for ingested papers and backfill progress."""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from mldigest.models import Paper
+from mldigest.utils import iso_timestamp
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT PRIMARY KEY,
+    published_at TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_published ON papers (published_at);
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_key TEXT PRIMARY KEY,
+    papers INTEGER NOT NULL,
+    completed_at TEXT NOT NULL
+);
+"""
+
+
+def default_store_path(cfg: dict) -> Path:
+    storage = cfg["storage"]
+    return Path(storage.get("paper_store_path") or Path(storage["runs_dir"]) / "papers.sqlite3")
+
+
+class PaperStore:
+    """Papers keyed by ``paper_id`` plus the set of completed backfill chunks."""
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "PaperStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self.conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0])
+
+    def _upsert(self, papers: Iterable[Paper]) -> int:
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT INTO papers (paper_id, published_at, payload) VALUES (?, ?, ?) "
+            "ON CONFLICT(paper_id) DO UPDATE SET published_at = excluded.published_at, payload = excluded.payload",
+            [
+                (
+                    paper.paper_id,
+                    iso_timestamp(paper.published_at),
+                    json.dumps(paper.to_dict(), ensure_ascii=False),
+                )
+                for paper in papers
+            ],
+        )
+        return self.conn.total_changes - before
+
+    def add_papers(self, papers: Iterable[Paper]) -> int:
+        with self.conn:
+            return self._upsert(papers)
+
+    def write_chunk(self, chunk_key: str, papers: list[Paper]) -> None:
+        """Store a chunk's papers and mark it complete in one transaction."""
+        with self.conn:
+            self._upsert(papers)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO chunks (chunk_key, papers, completed_at) VALUES (?, ?, ?)",
+                (chunk_key, len(papers), datetime.now(timezone.utc).isoformat()),
+            )
+
+    def completed_chunks(self) -> set[str]:
+        return {row[0] for row in self.conn.execute("SELECT chunk_key FROM chunks")}
+
+    def iter_papers(self, since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Paper]:
+        """Yield stored papers published in ``[since, until)`` in publication order."""
+        filters = []
+        params = []
+        if since:
+            filters.append("published_at >= ?")
+            params.append(since)
+        if until:
+            filters.append("published_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        for (payload,) in self.conn.execute(f"SELECT payload FROM papers {where} ORDER BY published_at", params):
+            yield Paper.from_dict(json.loads(payload))
@@ -0,0 +1,154 @@
+"""Append-only per-run performance history (JSONL) with OpenMetrics export."""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# name -> (unit, help, whether a higher value is a regression)
+METRICS: Dict[str, Tuple[str, str, bool]] = {
+    "mldigest_run_seconds": ("seconds", "Wall time of the whole run", True),
+    "mldigest_stage_seconds": ("seconds", "Own wall time of a pipeline stage", True),
+    "mldigest_signal_seconds": ("seconds", "Time spent in one batch signal (summed over workers)", True),
+    "mldigest_http_requests": ("", "HTTP attempts per upstream, retries included", True),
+    "mldigest_http_retries": ("", "Retried HTTP attempts per upstream", True),
+    "mldigest_http_errors": ("", "HTTP attempts that failed or returned >= 400", True),
+    "mldigest_http_response_bytes": ("bytes", "Response bytes per upstream", True),
+    "mldigest_http_seconds": ("seconds", "Summed request latency per upstream", True),
+    "mldigest_openreview_notes": ("", "OpenReview notes read per venue", False),
+    "mldigest_openreview_response_bytes": ("bytes", "OpenReview listing bytes per venue", True),
+    "mldigest_candidates": ("", "Candidate counts per source", False),
+}
+
+# Absolute change below which a metric is never flagged, so a 0.2s stage
+# doubling to 0.4s does not raise an alert.
+NOISE_FLOOR = {"seconds": 1.0, "bytes": 256 * 1024, "": 10}
+
+Sample = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def default_history_path(cfg: dict) -> Path:
+    storage = cfg["storage"]
+    return Path(storage.get("perf_history_path") or Path(storage["runs_dir"]) / "perf_history.jsonl")
+
+
+def append_run(path: str | Path, record: dict) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def load_history(path: str | Path) -> List[dict]:
+    path = Path(path)
+    if not path.exists():
+        return []
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line:
+            records.append(json.loads(line))
+    return records
+
+
+def flatten(record: dict) -> Dict[Sample, float]:
+    """Metric samples of one run keyed by ``(name, labels)``.
+
+    Stages restored from a checkpoint are left out: their timing says nothing
+    about how long the work takes.
+    """
+    samples: dict[Sample, float] = {("mldigest_run_seconds", ()): record["total_seconds"]}
+    for stage, timing in record.get("stages", {}).items():
+        if not timing.get("resumed"):
+            samples[("mldigest_stage_seconds", (("stage", stage),))] = timing["seconds"]
+    for signal, seconds in record.get("signals", {}).items():
+        samples[("mldigest_signal_seconds", (("signal", signal),))] = seconds
+    for source, stats in record.get("requests", {}).items():
+        labels = (("source", source),)
+        samples[("mldigest_http_requests", labels)] = stats["requests"]
+        samples[("mldigest_http_retries", labels)] = stats["retries"]
+        samples[("mldigest_http_errors", labels)] = stats["errors"]
+        samples[("mldigest_http_response_bytes", labels)] = stats["bytes"]
+        samples[("mldigest_http_seconds", labels)] = stats["seconds"]
+    for venue, stats in record.get("openreview", {}).items():
+        labels = (("venue", venue),)
+        samples[("mldigest_openreview_notes", labels)] = stats.get("notes", 0)
+        samples[("mldigest_openreview_response_bytes", labels)] = stats.get("bytes", 0)
+    for kind, count in record.get("counts", {}).items():
+        samples[("mldigest_candidates", (("kind", kind),))] = count
+    return samples
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def to_openmetrics(records: Iterable[dict], timestamps: bool = False) -> str:
+    """OpenMetrics text exposition, one gauge family per metric.
+
+    With ``timestamps`` every record becomes a timestamped sample (a backfill
+    of the whole history); without, pass only the latest record to get a
+    node_exporter textfile.
+    """
+    rows: dict[str, list[str]] = {name: [] for name in METRICS}
+    for record in records:
+        suffix = ""
+        if timestamps:
+            suffix = f" {datetime.fromisoformat(record['timestamp']).timestamp():.3f}"
+        for (name, labels), value in flatten(record).items():
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels)
+            rows[name].append(f"{name}{{{label_text}}} {value}{suffix}" if labels else f"{name} {value}{suffix}")
+    lines = []
+    for name, (unit, help_text, _) in METRICS.items():
+        if not rows[name]:
+            continue
+        lines.append(f"# TYPE {name} gauge")
+        if unit:
+            lines.append(f"# UNIT {name} {unit}")
+        lines.append(f"# HELP {name} {help_text}")
+        lines.extend(rows[name])
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def find_regressions(
+    history: List[dict],
+    baseline_runs: int = 7,
+    threshold: float = 0.3,
+    latest: Optional[dict] = None,
+) -> List[dict]:
+    """Compare ``latest`` (default: last record) with the median of the runs before it.
+
+    A metric regresses when it exceeds the baseline median by more than
+    ``threshold`` (relative) and by more than its unit's :data:`NOISE_FLOOR`.
+    """
+    if latest is None:
+        if not history:
+            return []
+        latest, history = history[-1], history[:-1]
+    baseline_records = [flatten(record) for record in history[-baseline_runs:]]
+    regressions = []
+    for sample, value in flatten(latest).items():
+        name, labels = sample
+        unit, _, higher_is_worse = METRICS[name]
+        if not higher_is_worse:
+            continue
+        previous = [samples[sample] for samples in baseline_records if sample in samples]
+        if not previous:
+            continue
+        baseline = median(previous)
+        if value - baseline <= NOISE_FLOOR[unit] or value <= baseline * (1 + threshold):
+            continue
+        regressions.append(
+            {
+                "metric": name,
+                "labels": dict(labels),
+                "value": value,
+                "baseline": baseline,
+                "ratio": round(value / baseline, 2) if baseline else None,
+                "baseline_runs": len(previous),
+            }
+        )
+    return regressions
@@ -0,0 +1,195 @@
+"""Local BM25 search index backed by SQLite."""
+from __future__ import annotations
+
+import math
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from mldigest.models import Paper
+from mldigest.utils import iso_timestamp, tokenize
+
+K1 = 1.2
+B = 0.75
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id INTEGER PRIMARY KEY,
+    paper_id TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    published_at TEXT,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('doc_count', 0), ('total_length', 0);
+"""
+
+
+def default_index_path(cfg: dict) -> Path:
+    storage = cfg["storage"]
+    return Path(storage.get("index_path") or Path(storage["runs_dir"]) / "search_index.sqlite3")
+
+
+def exploration_relevance(cfg: dict, papers: List[Paper]) -> Optional[dict[str, float]]:
+    """BM25 relevance of ``papers`` to ``selection_strategy.exploration.query``, or ``None`` without a query.
+
+    This is the ``relevance`` input of the exploration score (weighted by
+    ``exploration.weights.relevance``).
+    """
+    query = cfg["selection_strategy"]["exploration"].get("query")
+    if not query:
+        return None
+    with SearchIndex(default_index_path(cfg)) as index:
+        return index.relevance_scores(query, [paper.paper_id for paper in papers])
+
+
+def paper_terms(paper: Paper) -> Counter:
+    text = " ".join([paper.title, paper.abstract or "", " ".join(paper.keyphrases)])
+    return Counter(tokenize(text))
+
+
+class SearchIndex:
+    """Inverted index over title, abstract and keyphrases with BM25 ranking.
+
+    Postings are clustered by term so a query only touches the posting lists of
+    its own terms, and papers are added or replaced without a rebuild.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._meta("doc_count")
+
+    def _meta(self, key: str) -> int:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return int(row[0]) if row else 0
+
+    def _remove_doc(self, doc_id: int, length: int) -> None:
+        terms = [row[0] for row in self.conn.execute("SELECT term FROM postings WHERE doc_id = ?", (doc_id,))]
+        self.conn.executemany("UPDATE terms SET df = df - 1 WHERE term = ?", [(term,) for term in terms])
+        self.conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+        self.conn.execute("UPDATE meta SET value = value - 1 WHERE key = 'doc_count'")
+        self.conn.execute("UPDATE meta SET value = value - ? WHERE key = 'total_length'", (length,))
+
+    def add_papers(self, papers: Iterable[Paper]) -> int:
+        """Add or replace papers; returns the number of documents written."""
+        written = 0
+        with self.conn:
+            for paper in papers:
+                terms = paper_terms(paper)
+                length = sum(terms.values())
+                row = self.conn.execute(
+                    "SELECT doc_id, length FROM docs WHERE paper_id = ?", (paper.paper_id,)
+                ).fetchone()
+                if row:
+                    self._remove_doc(row[0], row[1])
+                cursor = self.conn.execute(
+                    "INSERT INTO docs (paper_id, title, published_at, length) VALUES (?, ?, ?, ?)",
+                    (paper.paper_id, paper.title, iso_timestamp(paper.published_at), length),
+                )
+                doc_id = cursor.lastrowid
+                self.conn.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    [(term, doc_id, tf) for term, tf in terms.items()],
+                )
+                self.conn.executemany(
+                    "INSERT INTO terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                    [(term,) for term in terms],
+                )
+                self.conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'doc_count'")
+                self.conn.execute("UPDATE meta SET value = value + ? WHERE key = 'total_length'", (length,))
+                written += 1
+        return written
+
+    def _query_weights(self, query: str) -> list[tuple[str, float]]:
+        doc_count = self._meta("doc_count")
+        weights = []
+        for term in sorted(set(tokenize(query))):
+            row = self.conn.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+            df = row[0] if row else 0
+            if df <= 0:
+                continue
+            weights.append((term, math.log(1 + (doc_count - df + 0.5) / (df + 0.5))))
+        return weights
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        since: Optional[str] = None,
+        paper_ids: Optional[List[str]] = None,
+    ) -> list[tuple[str, str, Optional[str], float]]:
+        """Return ``(paper_id, title, published_at, score)`` ranked by BM25."""
+        weights = self._query_weights(query)
+        doc_count = self._meta("doc_count")
+        if not weights or not doc_count:
+            return []
+        avgdl = max(self._meta("total_length") / doc_count, 1.0)
+        values = ", ".join("(?, ?)" for _ in weights)
+        params: list = [value for pair in weights for value in pair]
+        filters = []
+        if since:
+            filters.append("d.published_at >= ?")
+            params.append(since)
+        if paper_ids is not None:
+            if not paper_ids:
+                return []
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS scope (paper_id TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM scope")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO scope (paper_id) VALUES (?)", [(paper_id,) for paper_id in paper_ids]
+            )
+            filters.append("d.paper_id IN (SELECT paper_id FROM scope)")
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        sql = f"""
+            WITH q(term, idf) AS (VALUES {values})
+            SELECT d.paper_id, d.title, d.published_at,
+                   SUM(q.idf * p.tf * {K1 + 1} / (p.tf + {K1} * (1 - {B} + {B} * d.length / {avgdl})))
+                       AS score
+            FROM q
+            JOIN postings p ON p.term = q.term
+            JOIN docs d ON d.doc_id = p.doc_id
+            {where}
+            GROUP BY d.doc_id
+            ORDER BY score DESC
+            LIMIT ?
+        """
+        params.append(limit)
+        return [(row[0], row[1], row[2], float(row[3])) for row in self.conn.execute(sql, params)]
+
+    def relevance_scores(self, query: str, paper_ids: List[str]) -> dict[str, float]:
+        """BM25 scores for ``paper_ids`` scaled into [0, 1] by the best match."""
+        hits = self.search(query, limit=len(paper_ids) or 1, paper_ids=paper_ids)
+        if not hits:
+            return {}
+        best = hits[0][3] or 1.0
+        return {paper_id: score / best for paper_id, _title, _published, score in hits}
@@ -0,0 +1,263 @@
+"""Materialized daily per-topic counts backed by SQLite."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from mldigest.models import Paper
+from mldigest.signals.keywords import match_topics
+from mldigest.utils import iso_timestamp
+
+# Source label of the rows that count each paper once, whatever its sources.
+ALL_SOURCES = "*"
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    hf_hit INTEGER NOT NULL,
+    accepted INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paper_topics (
+    topic TEXT NOT NULL,
+    paper_id TEXT NOT NULL,
+    PRIMARY KEY (topic, paper_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS paper_topics_paper ON paper_topics (paper_id);
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    source TEXT NOT NULL,
+    papers INTEGER NOT NULL,
+    hf_hits INTEGER NOT NULL,
+    accepts INTEGER NOT NULL,
+    PRIMARY KEY (day, topic, source)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS topic_defs (
+    topic TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+# (day, sources, hf_hit, accepted, topics)
+_Entry = Tuple[str, Tuple[str, ...], int, int, Tuple[str, ...]]
+_Key = Tuple[str, str, str]
+
+
+def default_rollup_path(cfg: dict) -> Path:
+    storage = cfg["storage"]
+    return Path(storage.get("rollup_path") or Path(storage["runs_dir"]) / "topic_rollups.sqlite3")
+
+
+def _keywords_fingerprint(keywords: List[str]) -> str:
+    return hashlib.sha256(json.dumps(sorted(keyword.lower() for keyword in keywords)).encode("utf-8")).hexdigest()
+
+
+def _accepted(paper: Paper, accept_only: bool) -> int:
+    signal = paper.signals.get("openreview") or {}
+    if not signal or signal.get("rejected"):
+        return 0
+    decision = str(signal.get("decision") or "").lower()
+    if decision:
+        return int("accept" in decision)
+    # Accept-only listings are filtered server-side, so an unread decision is an accept.
+    return int(accept_only)
+
+
+def _contributions(entry: _Entry, topics: Iterable[str], sign: int, deltas: Dict[_Key, list]) -> None:
+    day, sources, hf_hit, accepted, _ = entry
+    for topic in topics:
+        for source in (ALL_SOURCES, *sources):
+            counts = deltas.setdefault((day, topic, source), [0, 0, 0])
+            counts[0] += sign
+            counts[1] += sign * hf_hit
+            counts[2] += sign * accepted
+
+
+class TopicRollups:
+    """Daily paper / HF hit / OpenReview accept counts per ``topics.buckets`` topic and source.
+
+    Every paper seen is kept in a small ledger (day, sources, evidence and
+    text), so re-ingesting an overlapping window only applies the difference
+    to the rollups, and a bucket whose keywords change is recomputed from the
+    ledger on its own without touching the other topics.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "TopicRollups":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self.conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0])
+
+    def _apply(self, deltas: Dict[_Key, list]) -> None:
+        self.conn.executemany(
+            "INSERT INTO daily (day, topic, source, papers, hf_hits, accepts) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(day, topic, source) DO UPDATE SET papers = papers + excluded.papers, "
+            "hf_hits = hf_hits + excluded.hf_hits, accepts = accepts + excluded.accepts",
+            [(*key, *counts) for key, counts in deltas.items() if any(counts)],
+        )
+        self.conn.execute("DELETE FROM daily WHERE papers <= 0")
+
+    def sync_buckets(self, buckets: Dict[str, List[str]]) -> List[str]:
+        """Bring the rollups in line with ``buckets``; returns the topics recomputed.
+
+        Removed topics are dropped; new topics and topics whose keywords
+        changed are re-matched against the ledger. Unchanged topics are left
+        as they are.
+        """
+        stored = dict(self.conn.execute("SELECT topic, fingerprint FROM topic_defs"))
+        current = {topic: _keywords_fingerprint(keywords) for topic, keywords in buckets.items()}
+        stale = [topic for topic in stored if stored[topic] != current.get(topic)]
+        changed = [topic for topic, value in current.items() if stored.get(topic) != value]
+        if not stale and not changed:
+            return []
+        with self.conn:
+            for topic in stale:
+                self.conn.execute("DELETE FROM daily WHERE topic = ?", (topic,))
+                self.conn.execute("DELETE FROM paper_topics WHERE topic = ?", (topic,))
+                self.conn.execute("DELETE FROM topic_defs WHERE topic = ?", (topic,))
+            if changed:
+                subset = {topic: buckets[topic] for topic in changed}
+                deltas: dict[_Key, list] = {}
+                members = []
+                for paper_id, day, sources, hf_hit, accepted, text in self.conn.execute(
+                    "SELECT paper_id, day, sources, hf_hit, accepted, text FROM papers"
+                ):
+                    topics = match_topics(text, subset)
+                    if topics:
+                        entry = (day, tuple(sources.split(",")) if sources else (), hf_hit, accepted, ())
+                        _contributions(entry, topics, 1, deltas)
+                        members.extend((topic, paper_id) for topic in topics)
+                self.conn.executemany("INSERT INTO paper_topics (topic, paper_id) VALUES (?, ?)", members)
+                self._apply(deltas)
+                self.conn.executemany(
+                    "INSERT INTO topic_defs (topic, fingerprint) VALUES (?, ?)",
+                    [(topic, current[topic]) for topic in changed],
+                )
+        return changed
+
+    def _stored(self, paper_ids: List[str]) -> Dict[str, _Entry]:
+        entries: dict[str, _Entry] = {}
+        for start in range(0, len(paper_ids), _CHUNK):
+            chunk = paper_ids[start : start + _CHUNK]
+            marks = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT paper_id, day, sources, hf_hit, accepted FROM papers WHERE paper_id IN ({marks})", chunk
+            ).fetchall()
+            topics: dict[str, list[str]] = {}
+            for topic, paper_id in self.conn.execute(
+                f"SELECT topic, paper_id FROM paper_topics WHERE paper_id IN ({marks})", chunk
+            ):
+                topics.setdefault(paper_id, []).append(topic)
+            for paper_id, day, sources, hf_hit, accepted in rows:
+                entries[paper_id] = (
+                    day,
+                    tuple(sources.split(",")) if sources else (),
+                    hf_hit,
+                    accepted,
+                    tuple(sorted(topics.get(paper_id, []))),
+                )
+        return entries
+
+    def add_papers(self, papers: Iterable[Paper], accept_only: bool = True) -> int:
+        """Fold papers (with ``topics`` assigned) into the rollups; returns the papers that changed anything.
+
+        Evidence only accumulates: a paper keeps its HF hit, accept and
+        sources from earlier runs even if a later ingest no longer sees them.
+        """
+        papers = list({paper.paper_id: paper for paper in papers if paper.published_at}.values())
+        stored = self._stored([paper.paper_id for paper in papers])
+        deltas: dict[_Key, list] = {}
+        ledger = []
+        memberships = []
+        for paper in papers:
+            old = stored.get(paper.paper_id)
+            sources = set(paper.source_tags)
+            hf_hit = int(bool(paper.signals.get("hf")))
+            accepted = _accepted(paper, accept_only)
+            if old:
+                sources |= set(old[1])
+                hf_hit, accepted = max(hf_hit, old[2]), max(accepted, old[3])
+            day = iso_timestamp(paper.published_at)[:10]
+            entry = (day, tuple(sorted(sources)), hf_hit, accepted, tuple(sorted(paper.topics)))
+            if entry == old:
+                continue
+            if old:
+                _contributions(old, old[4], -1, deltas)
+            _contributions(entry, entry[4], 1, deltas)
+            text = f"{paper.title} {paper.abstract or ''}"
+            ledger.append((paper.paper_id, day, ",".join(entry[1]), hf_hit, accepted, text))
+            memberships.append((paper.paper_id, entry[4]))
+        if not ledger:
+            return 0
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO papers (paper_id, day, sources, hf_hit, accepted, text) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ledger,
+            )
+            self.conn.executemany(
+                "DELETE FROM paper_topics WHERE paper_id = ?", [(paper_id,) for paper_id, _ in memberships]
+            )
+            self.conn.executemany(
+                "INSERT INTO paper_topics (topic, paper_id) VALUES (?, ?)",
+                [(topic, paper_id) for paper_id, topics in memberships for topic in topics],
+            )
+            self._apply(deltas)
+        return len(ledger)
+
+    def momentum(self, as_of: date, recent_days: int = 7, baseline_days: int = 28) -> List[dict]:
+        """Per-topic activity in the ``recent_days`` up to ``as_of`` against the ``baseline_days`` before.
+
+        Reads only the rollup rows inside those two windows, so the cost does
+        not grow with the stored history. ``growth`` compares the recent count
+        with the baseline scaled to the same length (``None`` without a baseline).
+        """
+        recent_start = as_of - timedelta(days=recent_days - 1)
+        baseline_start = recent_start - timedelta(days=baseline_days)
+        topics: dict[str, dict] = {}
+        for day, topic, source, papers, hf_hits, accepts in self.conn.execute(
+            "SELECT day, topic, source, papers, hf_hits, accepts FROM daily WHERE day >= ? AND day <= ?",
+            (baseline_start.isoformat(), as_of.isoformat()),
+        ):
+            row = topics.setdefault(
+                topic, {"topic": topic, "recent": 0, "baseline": 0, "hf_hits": 0, "accepts": 0, "sources": {}}
+            )
+            recent = day >= recent_start.isoformat()
+            if source != ALL_SOURCES:
+                if recent:
+                    row["sources"][source] = row["sources"].get(source, 0) + papers
+                continue
+            if recent:
+                row["recent"] += papers
+                row["hf_hits"] += hf_hits
+                row["accepts"] += accepts
+            else:
+                row["baseline"] += papers
+        results = []
+        for row in topics.values():
+            expected = row["baseline"] * recent_days / baseline_days
+            row["expected"] = round(expected, 2)
+            row["growth"] = round(row["recent"] / expected - 1, 3) if expected else None
+            results.append(row)
+        results.sort(key=lambda row: (row["growth"] is not None, row["growth"] or 0, row["recent"]), reverse=True)
+        return results
@@ -0,0 +1,115 @@
+from __future__ import annotations
+import argparse
+import json
+import time
+from pathlib import Path
+from mldigest.config import load_config
+from mldigest.models import Paper
+from mldigest.selector.sweep import WeightSweep, build_settings, parse_parameter, summarize
+from mldigest.storage.checkpoints import decode_candidates
+from mldigest.storage.search_index import exploration_relevance
+from mldigest.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def _latest_snapshot(runs_dir: str) -> Path | None:
+    snapshots = sorted(
+        (Path(runs_dir) / "checkpoints").glob("*/enriched.json"), key=lambda path: path.stat().st_mtime
+    )
+    return snapshots[-1] if snapshots else None
+
+
+def _load_hf_hits(snapshot: Path, candidates: list[Paper]) -> dict:
+    ingest_path = snapshot.with_name("ingest.json")
+    if ingest_path.exists():
+        return json.loads(ingest_path.read_text(encoding="utf-8"))["data"]["hf_hits"]
+    return {paper.paper_id: paper.signals["hf"] for paper in candidates if paper.signals.get("hf")}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep selection weights over a stored, enriched candidate pool")
+    parser.add_argument("--config", required=True, help="Path to config YAML")
+    parser.add_argument(
+        "--snapshot",
+        help="Enriched checkpoint to sweep (default: the newest runs_dir/checkpoints/*/enriched.json)",
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        help="Weight to vary, e.g. trending.weights.hf_rank=0:1:11 or quality.venue_bonus.ICLR=0,0.5,1",
+    )
+    parser.add_argument("--samples", type=int, help="Draw this many random settings instead of the full grid")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --samples")
+    parser.add_argument("--top", type=int, default=5, help="Picks to list per slot")
+    parser.add_argument("--json", dest="json_out", help="Write every setting and its picks to this path")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config).data
+    snapshot = Path(args.snapshot) if args.snapshot else _latest_snapshot(cfg["storage"]["runs_dir"])
+    if snapshot is None or not snapshot.exists():
+        parser.error("No enriched checkpoint found; run mldigest.run first or pass --snapshot")
+    try:
+        parameters = dict(parse_parameter(spec) for spec in args.param)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    started = time.perf_counter()
+    candidates, _openreview_papers = decode_candidates(json.loads(snapshot.read_text(encoding="utf-8"))["data"])
+    hf_hits = _load_hf_hits(snapshot, candidates)
+    relevance = exploration_relevance(cfg, candidates)
+    sweep = WeightSweep(candidates, hf_hits, cfg, relevance=relevance)
+    prepared = time.perf_counter()
+
+    settings = build_settings(parameters, samples=args.samples, seed=args.seed) if parameters else [{}]
+    reference = sweep.evaluate([{}])[0]
+    results = sweep.evaluate(settings)
+    elapsed = time.perf_counter() - prepared
+    logger.info(
+        "%d candidates from %s loaded in %.2fs; %d settings evaluated in %.2fs (%.0f settings/s)",
+        len(candidates),
+        snapshot,
+        prepared - started,
+        len(settings),
+        elapsed,
+        len(settings) / elapsed if elapsed else float("inf"),
+    )
+
+    summary = summarize(results, reference, sweep.slots)
+    logger.info(
+        "%d distinct selections; most common covers %.0f%% of settings, current config's %.0f%%",
+        summary["distinct_selections"],
+        summary["modal_selection_share"] * 100,
+        summary["unchanged_share"] * 100,
+    )
+    for stats in summary["slots"]:
+        logger.info(
+            "slot %d (%s): %d distinct picks, %.0f%% agree with the current config",
+            stats["slot"],
+            stats["role"],
+            stats["distinct"],
+            stats["agreement_with_config"] * 100,
+        )
+        for pick in stats["picks"][: args.top]:
+            logger.info("  %5.1f%%  %s  %s", pick["share"] * 100, pick["paper_id"], pick["title"][:80])
+
+    if args.json_out:
+        rows = [
+            {
+                "weights": setting,
+                "picks": [
+                    {"role": role, "paper_id": paper.paper_id if paper else None}
+                    for role, paper in zip(sweep.slots, result)
+                ],
+            }
+            for setting, result in zip(settings, results)
+        ]
+        Path(args.json_out).write_text(
+            json.dumps({"snapshot": str(snapshot), "summary": summary, "settings": rows}, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
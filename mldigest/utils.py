@@ -3,9 +3,12 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Iterable, Optional, Tuple
 
+import requests
 from dateutil import parser
 from rapidfuzz import fuzz
 
@@ -27,6 +30,19 @@ def normalize_title(title: str) -> str:
     return normalized
 
 
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the this to we with "
+    "our via using which can these their into than also such".split()
+)
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]{2,}")
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
 def fuzzy_title_match(title_a: str, title_b: str, threshold: int = 90) -> bool:
     return fuzz.token_set_ratio(normalize_title(title_a), normalize_title(title_b)) >= threshold
 
@@ -34,19 +50,38 @@ def fuzzy_title_match(title_a: str, title_b: str, threshold: int = 90) -> bool:
 def parse_iso_date(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        pass
     try:
         return parser.isoparse(value)
     except (ValueError, TypeError):
         return None
 
 
-def days_since(iso_date: Optional[str]) -> Optional[int]:
+def iso_timestamp(value: str | int | float | None) -> Optional[str]:
+    """``published_at`` as ISO 8601 text, so stored dates sort and compare as strings.
+
+    OpenReview ``pdate`` values are epoch milliseconds (ints, or digit strings
+    once they have been through JSON or SQLite); they become UTC timestamps.
+    Anything else is returned as given.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+        moment = datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc)
+        return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return value
+
+
+def days_since(iso_date: Optional[str], now: Optional[datetime] = None) -> Optional[int]:
     dt = parse_iso_date(iso_date)
     if not dt:
         return None
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     return max(0, (now - dt).days)
 
 
@@ -81,3 +116,78 @@ def normalize_scores(values: Iterable[float]) -> list[float]:
 
 def dedupe_arxiv_id(arxiv_id: str) -> str:
     return re.sub(r"v\d+$", "", arxiv_id)
+
+
+class RateLimiter:
+    """Spaces out call start times across threads by at least ``min_interval`` seconds."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_request_stats: dict[str, dict] = {}
+_request_stats_lock = threading.Lock()
+
+
+def _record_request(source: str, response: Optional[requests.Response], seconds: float, retried: bool) -> None:
+    with _request_stats_lock:
+        stats = _request_stats.setdefault(
+            source, {"requests": 0, "retries": 0, "errors": 0, "bytes": 0, "seconds": 0.0}
+        )
+        stats["requests"] += 1
+        stats["retries"] += int(retried)
+        stats["seconds"] += seconds
+        if response is None or response.status_code >= 400:
+            stats["errors"] += 1
+        if response is not None:
+            stats["bytes"] += len(response.content or b"")
+
+
+def request_stats() -> dict:
+    """Per-source totals of every :func:`get_with_retry` attempt in this process."""
+    with _request_stats_lock:
+        return {source: {**stats, "seconds": round(stats["seconds"], 4)} for source, stats in _request_stats.items()}
+
+
+def get_with_retry(
+    url: str,
+    params: dict | None = None,
+    timeout: float = 30,
+    retries: int = 2,
+    source: str = "other",
+    rate_limiter: Optional[RateLimiter] = None,
+) -> requests.Response:
+    """``requests.get`` that retries throttled or failed responses, honouring ``Retry-After``.
+
+    Every attempt is counted under ``source`` in :func:`request_stats` and,
+    with ``rate_limiter``, waits for its turn like any other request.
+    """
+    for attempt in range(retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        started = time.perf_counter()
+        try:
+            response = requests.get(url, params=params, timeout=timeout)
+        except requests.RequestException:
+            _record_request(source, None, time.perf_counter() - started, attempt > 0)
+            raise
+        _record_request(source, response, time.perf_counter() - started, attempt > 0)
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            response.raise_for_status()
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.replace(".", "", 1).isdigit() else 2.0**attempt
+        time.sleep(min(delay, 30.0))
+    raise AssertionError("unreachable")
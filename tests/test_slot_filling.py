@@ -0,0 +1,210 @@
+"""Heap slot filling against an exhaustive greedy reference on small random inputs."""
+from __future__ import annotations
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from mldigest.config import load_config
+from mldigest.models import Paper
+from mldigest.selector.constrained import (
+    DiversityHeap,
+    ScoreHeap,
+    SlotFiller,
+    fill_slots,
+    primary_topic,
+    slot_roles,
+)
+from mldigest.selector.orchestrator import select_papers
+from mldigest.utils import fuzzy_title_match
+
+CONFIG = Path(__file__).resolve().parent.parent / "config" / "config.example.yaml"
+TOPICS = ("Agents", "RAG", "Systems")
+WORDS = "sparse attention decoding cache retrieval planning kernel reward policy graph token memory".split()
+CHAINS = {
+    "trending": ("trending", "fallback", "recency"),
+    "quality": ("quality", "fallback", "recency"),
+    "exploration": ("exploration", "recency"),
+}
+
+
+def _paper(index: int, rng: random.Random) -> Paper:
+    return Paper(
+        paper_id=f"p{index}",
+        title=" ".join(rng.sample(WORDS, 5)),
+        authors=[],
+        abstract=None,
+        published_at=None,
+        categories=[],
+        links={},
+        source_tags=[],
+        topics=rng.sample(TOPICS, rng.randint(0, 2)),
+    )
+
+
+def _case(seed: int) -> dict:
+    """A few dozen papers with overlapping topics, copied titles and sometimes empty primary pools."""
+    rng = random.Random(seed)
+    papers = [_paper(index, rng) for index in range(rng.randint(12, 40))]
+    for paper in rng.sample(papers, len(papers) // 5):
+        paper.title = rng.choice(papers).title
+    if rng.random() < 0.5:
+        # One dominant topic, so the cap (and its relaxation) decides most slots.
+        for paper in papers:
+            if rng.random() < 0.8:
+                paper.topics = ["Agents", *paper.topics[1:]]
+    pools = {}
+    for name in ("trending", "quality", "exploration"):
+        size = rng.choice([0, 2, len(papers) // 3, len(papers)])
+        pools[name] = rng.sample(range(len(papers)), size)
+    pools["fallback"] = list(range(len(papers)))
+    pools["recency"] = list(range(len(papers)))
+    return {
+        "papers": papers,
+        "pools": pools,
+        "scores": {name: [rng.random() for _ in range(len(papers))] for name in pools},
+        "vectors": sparse.random(len(papers), 16, density=0.4, random_state=seed, format="csr"),
+        "weight": rng.choice([0.0, 0.5, 2.0]),
+        "cap": rng.randint(1, 3),
+        "roles": slot_roles(rng.randint(1, 12)),
+    }
+
+
+def _normalized(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+
+def _heap_fill(case: dict) -> tuple:
+    papers, pools, scores = case["papers"], case["pools"], case["scores"]
+    vectors = _normalized(case["vectors"])
+    filler = SlotFiller(case["cap"], vectors, {id(paper): row for row, paper in enumerate(papers)})
+
+    def scored(name: str):
+        return lambda: ScoreHeap((scores[name][index], papers[index]) for index in pools[name])
+
+    def exploration() -> DiversityHeap:
+        rows = pools["exploration"]
+        return DiversityHeap(
+            [papers[index] for index in rows],
+            np.array([scores["exploration"][index] for index in rows]),
+            vectors[rows],
+            filler.selected_vectors,
+            case["weight"],
+        )
+
+    builders = {name: scored(name) for name in ("trending", "quality", "fallback", "recency")}
+    builders["exploration"] = exploration
+    chains = {role: [(name, builders[name]) for name in sources] for role, sources in CHAINS.items()}
+    filled = fill_slots(case["roles"], filler, chains)
+    return [(role, paper.paper_id, source) for role, paper, source in filled], filler.per_topic_cap
+
+
+def _reference_fill(case: dict) -> tuple:
+    """Rescore and rescan every source from scratch for every slot: no heaps, no laziness."""
+    papers, pools, scores, weight = case["papers"], case["pools"], case["scores"], case["weight"]
+    vectors = _normalized(case["vectors"]).toarray()
+    selected: list[int] = []
+    cap = case["cap"]
+
+    def admissible(index: int) -> bool:
+        topic = primary_topic(papers[index])
+        counts = Counter(primary_topic(papers[chosen]) for chosen in selected)
+        if topic is not None and counts[topic] >= cap:
+            return False
+        return not any(
+            index == chosen or fuzzy_title_match(papers[index].title, papers[chosen].title) for chosen in selected
+        )
+
+    def score(name: str, index: int) -> float:
+        if name != "exploration":
+            return scores[name][index]
+        similarity = max((float(vectors[index] @ vectors[chosen]) for chosen in selected), default=0.0)
+        return scores[name][index] + weight * (1.0 - similarity)
+
+    filled = []
+    empty = list(case["roles"])
+    while True:
+        missing = []
+        for role in empty:
+            pick = None
+            for name in CHAINS[role]:
+                # Best score first; ties go to the earlier pool position, as in the heaps.
+                ranked = sorted(enumerate(pools[name]), key=lambda item: (-score(name, item[1]), item[0]))
+                pick = next((index for _, index in ranked if admissible(index)), None)
+                if pick is not None:
+                    selected.append(pick)
+                    filled.append((role, papers[pick].paper_id, name))
+                    break
+            if pick is None:
+                missing.append(role)
+        counts = Counter(primary_topic(papers[chosen]) for chosen in selected)
+        if not missing or not any(topic is not None and count >= cap for topic, count in counts.items()):
+            return filled, cap
+        cap += 1
+        empty = missing
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_fill_slots_matches_exhaustive_reference(seed):
+    case = _case(seed)
+    assert _heap_fill(case) == _reference_fill(case)
+
+
+def test_reference_cases_cover_cap_duplicates_and_fallbacks():
+    sources, relaxed, duplicates = Counter(), 0, 0
+    for seed in range(200):
+        case = _case(seed)
+        filled, cap = _reference_fill(case)
+        sources.update(source for _, _, source in filled)
+        relaxed += cap > case["cap"]
+        titles = [paper.title for paper in case["papers"]]
+        duplicates += len(titles) != len(set(titles))
+    assert sources["fallback"] and sources["recency"] and sources["exploration"]
+    assert relaxed and duplicates
+
+
+def _candidates(count: int, topics: list, rejected: int = 0) -> list:
+    now = datetime.now(timezone.utc)
+    rng = random.Random(count)
+    papers = []
+    for index in range(count):
+        paper = _paper(index, rng)
+        paper.title = f"{paper.title} {index}"
+        paper.abstract = " ".join(rng.choices(WORDS, k=30))
+        paper.published_at = (now - timedelta(days=index % 10)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        paper.topics = [topics[index % len(topics)]]
+        if index % 3 == 0:
+            paper.signals["openreview"] = {"venue": "ICLR.cc/2025/Conference", "mean_rating": 5 + index % 4}
+            if index < 3 * rejected:
+                paper.signals["openreview"]["rejected"] = True
+        papers.append(paper)
+    return papers
+
+
+def _config(papers_per_cycle: int, per_topic_cap: int) -> dict:
+    config = load_config(str(CONFIG)).data
+    config["limits"].update(papers_per_cycle=papers_per_cycle, per_topic_cap=per_topic_cap)
+    return config
+
+
+def test_select_papers_keeps_the_cap_when_topics_allow():
+    papers = _candidates(30, ["Agents", "RAG", "Systems"], rejected=3)
+    selected, debug = select_papers(papers, {}, _config(6, 2))
+    assert len(selected) == 6
+    assert max(Counter(primary_topic(paper) for paper in selected).values()) <= 2
+    assert not any((paper.signals.get("openreview") or {}).get("rejected") for paper in selected)
+    assert debug["slots"]["relaxed_per_topic_cap"] is None and not debug["slots"]["short"]
+
+
+def test_select_papers_relaxes_the_cap_for_a_single_topic_window():
+    papers = _candidates(20, ["Agents"])
+    selected, debug = select_papers(papers, {}, _config(5, 2))
+    assert len(selected) == 5
+    assert debug["slots"]["relaxed_per_topic_cap"] == 5 and not debug["slots"]["short"]